@@ -10,25 +10,12 @@ Usage:
 """
 
 import sys
-from pathlib import Path
 
-from dotenv import load_dotenv
-
-from rosetta_bot import Orchestrator
-from rosetta_bot.core import app_base_dir, ensure_env_exists
-
-
-def _default_env_file() -> str:
-    """Default .env location: next to the .exe when frozen, else project root."""
-    return str(app_base_dir() / ".env")
+from rosetta_bot.cli import main as run_cli
 
 
 def main() -> None:
-    env_file = sys.argv[1] if len(sys.argv) > 1 else _default_env_file()
-    ensure_env_exists(Path(env_file))
-    load_dotenv(env_file, override=True)
-
-    Orchestrator.from_env().run()
+    run_cli(sys.argv[1] if len(sys.argv) > 1 else None)
 
 
 if __name__ == "__main__":
@@ -16,91 +16,88 @@ Structure:
     - locators/: Centralized element locators for each page
 """
 
-# Main bot class
-from .bot import RosettaStoneBot
-
-# Orchestrator (fast path + browser-bot fallback)
-from .orchestrator import Orchestrator
-
-# Fast Stories usage-reporting capability
-from .fast import (
-    FastStoriesRunner,
-    FastReportConfig,
-    FastReportResult,
-    SessionBudget,
-    StateStore,
-    UsageApiClient,
-    DashboardReader,
-    compute_budget,
-)
-
-# Configuration
-from .config import AppConfig, BrowserConfig
-
-# Browser management
-from .browser import BrowserManager
-
-# Core module
-from .core import (
-    Timeouts,
-    WaitTimes,
-    URLs,
-    Logger,
-    LogLevel,
-    get_logger,
-)
-
-# Services
-from .services import (
-    AudioPlayerService,
-    ModeSwitcherService,
-    DebugService,
-    FrameFinderService,
-    TimeTracker,
-    get_user_status,
-    list_all_users,
-)
+from importlib import import_module
+
+# Public names and the submodule each one lives in. They are imported on
+# first access (PEP 562), so a fast-path-only run never pays for the sync
+# Playwright bot, pages and workflows.
+_EXPORTS = {
+    # Main bot class
+    "RosettaStoneBot": ".bot",
+    # Orchestrator (fast path + browser-bot fallback)
+    "Orchestrator": ".orchestrator",
+    # Fast Stories usage-reporting capability
+    "FastStoriesRunner": ".fast",
+    "FastReportConfig": ".fast",
+    "FastReportResult": ".fast",
+    "SessionBudget": ".fast",
+    "StateStore": ".fast",
+    "UsageApiClient": ".fast",
+    "DashboardReader": ".fast",
+    "compute_budget": ".fast",
+    # Configuration
+    "AppConfig": ".config",
+    "BrowserConfig": ".config",
+    # Browser management
+    "BrowserManager": ".browser",
+    # Core module
+    "Timeouts": ".core",
+    "WaitTimes": ".core",
+    "URLs": ".core",
+    "Logger": ".core",
+    "LogLevel": ".core",
+    "get_logger": ".core",
+    # Services
+    "AudioPlayerService": ".services",
+    "ModeSwitcherService": ".services",
+    "DebugService": ".services",
+    "FrameFinderService": ".services",
+    "StoryNavigatorService": ".services",
+    "TimeTracker": ".services",
+    "get_user_status": ".services",
+    "list_all_users": ".services",
+    # Workflows
+    "BaseWorkflow": ".workflows",
+    "StoriesWorkflow": ".workflows",
+    "LessonWorkflow": ".workflows",
+    # Page Objects
+    "BasePage": ".pages",
+    "LoginPage": ".pages",
+    "LaunchpadPage": ".pages",
+    "StoriesPage": ".pages",
+    "LessonPage": ".pages",
+    # Components
+    "AudioModal": ".components",
+    "CookieConsent": ".components",
+    "VoiceModal": ".components",
+    # Locators
+    "LoginLocators": ".locators",
+    "StoriesLocators": ".locators",
+    "LessonLocators": ".locators",
+    "LaunchpadLocators": ".locators",
+    "CommonLocators": ".locators",
+    # Exceptions
+    "RosettaBotError": ".exceptions",
+    "BrowserError": ".exceptions",
+    "AuthenticationError": ".exceptions",
+    "NavigationError": ".exceptions",
+    "ConfigurationError": ".exceptions",
+}
 
-# Workflows
-from .workflows import (
-    BaseWorkflow,
-    StoriesWorkflow,
-    LessonWorkflow,
-)
 
-# Page Objects
-from .pages import (
-    BasePage,
-    LoginPage,
-    LaunchpadPage,
-    StoriesPage,
-    LessonPage,
-)
+def __getattr__(name: str):
+    """Import a public name from its submodule on first access."""
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module, __name__), name)
+    globals()[name] = value
+    return value
 
-# Components
-from .components import (
-    AudioModal,
-    CookieConsent,
-    VoiceModal,
-)
 
-# Locators
-from .locators import (
-    LoginLocators,
-    StoriesLocators,
-    LessonLocators,
-    LaunchpadLocators,
-    CommonLocators,
-)
+def __dir__():
+    return sorted(list(globals()) + list(_EXPORTS))
 
-# Exceptions
-from .exceptions import (
-    RosettaBotError,
-    BrowserError,
-    AuthenticationError,
-    NavigationError,
-    ConfigurationError,
-)
 
 __version__ = "3.0.0"
 
@@ -135,6 +132,7 @@ __all__ = [
     "ModeSwitcherService",
     "DebugService",
     "FrameFinderService",
+    "StoryNavigatorService",
     "TimeTracker",
     "get_user_status",
     "list_all_users",
@@ -17,8 +17,8 @@ from playwright.sync_api import Playwright, Page
 from .config import AppConfig
 from .browser import BrowserManager
 from .core import app_base_dir, get_logger
+from .exceptions import BrowserError
 from .pages import LoginPage, LaunchpadPage
-from .workflows import StoriesWorkflow, LessonWorkflow
 from .services import TimeTracker
 
 
@@ -28,6 +28,9 @@ class RosettaStoneBot:
 
     Coordinates browser lifecycle, authentication, and workflow execution.
     Each workflow handles its own specific logic independently.
+
+    The browser and login are kept across run_* calls; call shutdown() when
+    done with the bot.
     """
 
     def __init__(self, config: AppConfig):
@@ -41,6 +44,7 @@ class RosettaStoneBot:
         self._browser_manager = BrowserManager(config.browser)
         self._logger = get_logger("Bot")
         self._page: Optional[Page] = None
+        self._authenticated = False
 
         # Time tracking (exe-relative dir so progress survives frozen runs)
         self._time_tracker = TimeTracker(
@@ -57,6 +61,16 @@ class RosettaStoneBot:
             raise RuntimeError("Browser not launched")
         return self._page
 
+    def invalidate_session(self) -> None:
+        """Force the next workflow to relaunch the browser and log in again."""
+        self._browser_manager.close()
+        self._page = None
+        self._authenticated = False
+
+    def shutdown(self) -> None:
+        """Close the browser and release all resources."""
+        self._cleanup()
+
     # ==================== Public Workflow Methods ====================
 
     def run(self, playwright: Playwright) -> None:
@@ -140,21 +154,26 @@ class RosettaStoneBot:
         try:
             self._logger.info(f"Starting {workflow_name} workflow...")
 
-            self._initialize(playwright)
-            self._authenticate()
+            self._start_session(playwright, navigate_to_lesson)
 
-            if navigate_to_lesson:
-                self._navigate_to_lesson()
-
-            run_method()
+            try:
+                run_method()
+            except BrowserError as e:
+                # The browser is reused for the whole run; only relaunch (and
+                # re-login) when it actually went away, and only once.
+                self._logger.warn(f"{e} Relaunching browser once...")
+                self.invalidate_session()
+                self._start_session(playwright, navigate_to_lesson)
+                run_method()
 
         finally:
-            # End time tracking
+            # End time tracking; the browser stays open for the next workflow
             self._time_tracker.end_session()
-            self._cleanup()
 
     def _run_stories_workflow(self) -> None:
         """Execute the stories workflow."""
+        from .workflows import StoriesWorkflow
+
         workflow = StoriesWorkflow(
             self._page,
             debug_enabled=self._config.debug_enabled,
@@ -164,15 +183,20 @@ class RosettaStoneBot:
 
     def _run_lesson_workflow(self) -> None:
         """Execute the infinite lesson workflow."""
+        from .workflows import LessonWorkflow
+
         workflow = LessonWorkflow(
             self._page,
             debug_enabled=self._config.debug_enabled,
             logger=get_logger("Lesson"),
+            recycle_page=self._recycle_page,
         )
         workflow.run_infinite()
 
     def _run_standard_lesson(self) -> None:
         """Execute the standard lesson activity loop."""
+        from .workflows import LessonWorkflow
+
         workflow = LessonWorkflow(
             self._page,
             debug_enabled=self._config.debug_enabled,
@@ -180,8 +204,41 @@ class RosettaStoneBot:
         )
         workflow.run_standard_loop()
 
+    def _recycle_page(self, url: str) -> Optional[Page]:
+        """
+        Move the session to a fresh page opened on url.
+
+        Returns:
+            The new page, or None if the current one is kept
+        """
+        page = self._browser_manager.recycle_page(url)
+        if page is not None:
+            self._page = page
+        return page
+
     # ==================== Setup Methods ====================
 
+    def _start_session(self, playwright: Playwright, navigate_to_lesson: bool) -> None:
+        """
+        Launch the browser, log in and optionally open the lesson.
+
+        Reuses the browser and login from a previous workflow while its page
+        is still open.
+        """
+        if self._page is None or self._page.is_closed():
+            # Release whatever is left of the old browser before relaunching
+            self.invalidate_session()
+            self._initialize(playwright)
+
+        if not self._authenticated:
+            self._authenticate()
+            self._authenticated = True
+        else:
+            self._logger.info("Reusing existing browser session.")
+
+        if navigate_to_lesson:
+            self._navigate_to_lesson()
+
     def _initialize(self, playwright: Playwright) -> None:
         """Initialize browser."""
         self._logger.info("Initializing browser...")
@@ -210,10 +267,14 @@ class RosettaStoneBot:
             self._page,
             self._config.debug_enabled,
             lesson_name=self._config.lesson_name,
+            voice_modal_timeout=self._config.browser.voice_modal_timeout_ms,
+            ui_language=self._config.ui_language,
         )
         launchpad.navigate_to_lesson()
 
     def _cleanup(self) -> None:
         """Clean up resources."""
         self._browser_manager.close()
+        self._page = None
+        self._authenticated = False
         self._logger.info("Bot finished.")
@@ -1,7 +1,9 @@
 """Browser management for the Rosetta Stone Bot."""
 
+import re
+import time
 from pathlib import Path
-from typing import Optional
+from typing import Callable, Optional, TypeVar
 
 from playwright.sync_api import (
     Playwright,
@@ -13,6 +15,34 @@ from playwright.sync_api import (
 from .config import BrowserConfig
 from .core import channel_candidates
 
+# Static assets the bot never looks at. Audio/video containers are left alone
+# because lesson and story audio must keep loading.
+_BLOCKED_ASSETS = "**/*.{png,jpg,jpeg,gif,webp,ico,woff,woff2,ttf,otf}"
+_BLOCKED_TRACKERS = re.compile(
+    r"google-analytics|googletagmanager|segment\.(io|com)|datadoghq|hotjar|mixpanel"
+)
+
+_T = TypeVar("_T")
+
+
+def _with_backoff(
+    fn: Callable[[], _T],
+    initial: float = 0.5,
+    factor: float = 2.0,
+    max_delay: float = 8.0,
+    tries: int = 4,
+) -> _T:
+    """Call fn, retrying transient failures with exponential backoff."""
+    for attempt in range(tries):
+        try:
+            return fn()
+        except Exception as exc:
+            if attempt == tries - 1:
+                raise
+            delay = min(initial * factor**attempt, max_delay)
+            print(f"[WARN] {exc} - retrying in {delay:.1f}s...")
+            time.sleep(delay)
+
 
 class BrowserManager:
     """Manages browser lifecycle and configuration."""
@@ -38,7 +68,9 @@ class BrowserManager:
         """Initialize the browser, preferring a system-installed channel.
 
         Tries channels in order (chrome -> msedge -> bundled Chromium) so a
-        packaged .exe works without `playwright install`.
+        packaged .exe works without `playwright install`. Each channel is
+        tried once; the launch timeout comes from the config so slow hosts
+        can raise it.
         """
         args = [
             "--disable-blink-features=AutomationControlled",
@@ -53,20 +85,15 @@ class BrowserManager:
                     slow_mo=self.config.slow_mo,
                     args=args,
                     channel=channel,
+                    timeout=self.config.launch_timeout_ms,
                 )
                 return
             except Exception as exc:
                 last_error = exc
-        # Last resort: bundled Chromium with no extra flags
-        try:
-            self.browser = playwright.chromium.launch(
-                headless=self.config.headless, slow_mo=self.config.slow_mo
-            )
-        except Exception as exc:
-            raise RuntimeError(
-                "Could not launch a browser. Install Chrome/Edge or run "
-                "'playwright install chromium'."
-            ) from (last_error or exc)
+        raise RuntimeError(
+            "Could not launch a browser. Install Chrome/Edge or run "
+            "'playwright install chromium'."
+        ) from last_error
 
     def _create_context(self) -> None:
         """Create browser context with realistic settings."""
@@ -89,7 +116,19 @@ class BrowserManager:
             print(f"[INFO] Reusing saved login session: {state_path}")
             context_kwargs["storage_state"] = state_path
 
-        self.context = self.browser.new_context(**context_kwargs)
+        self.context = _with_backoff(
+            lambda: self.browser.new_context(**context_kwargs)
+        )
+        self.context.set_default_timeout(self.config.default_timeout_ms)
+        self.context.set_default_navigation_timeout(self.config.nav_timeout_ms)
+
+        if self.config.block_resources:
+            self._block_unneeded_resources()
+
+    def _block_unneeded_resources(self) -> None:
+        """Abort image, font and analytics requests for the whole context."""
+        self.context.route(_BLOCKED_ASSETS, lambda route: route.abort())
+        self.context.route(_BLOCKED_TRACKERS, lambda route: route.abort())
 
     def save_storage_state(self) -> None:
         """Persist cookies/localStorage so later runs can skip the login."""
@@ -108,14 +147,55 @@ class BrowserManager:
         if not self.context:
             raise RuntimeError("Browser context not created")
 
-        self.page = self.context.new_page()
+        self.page = _with_backoff(self.context.new_page)
+
+    def recycle_page(self, url: str) -> Optional[Page]:
+        """Replace the main page with a fresh one opened on url.
+
+        A long-running tab keeps growing (detached nodes, decoded audio); a
+        new page in the same context starts clean and shares the login
+        cookies. The old page is closed only once the new one has loaded.
+
+        Returns:
+            The new main page, or None if it could not be opened (the
+            current page is then kept)
+        """
+        if not self.context:
+            return None
+        new_page: Optional[Page] = None
+        try:
+            new_page = self.context.new_page()
+            new_page.goto(url, wait_until="commit")
+        except Exception as exc:
+            print(f"[WARN] Could not open a fresh page: {exc}")
+            if new_page:
+                try:
+                    new_page.close()
+                except Exception:
+                    pass
+            return None
+
+        old_page, self.page = self.page, new_page
+        if old_page:
+            try:
+                old_page.close()
+            except Exception:
+                pass
+        return new_page
 
     def close(self) -> None:
-        """Close browser, context and page."""
-        if self.page:
-            self.page.close()
-        if self.context:
-            self.context.close()
-        if self.browser:
-            self.browser.close()
+        """Close browser, context and page.
+
+        Safe to call on an already closed or crashed browser, so the manager
+        can be relaunched afterwards.
+        """
+        for resource in (self.page, self.context, self.browser):
+            if resource:
+                try:
+                    resource.close()
+                except Exception:
+                    pass
+        self.page = None
+        self.context = None
+        self.browser = None
         print("[INFO] Browser closed.")
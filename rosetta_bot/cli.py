@@ -0,0 +1,33 @@
+"""
+Command-line entry point shared by every launcher.
+
+Loads the .env file (creating it interactively on first run) and runs the
+orchestrator. ``main.py`` and the PyInstaller build only wrap this function.
+"""
+
+from pathlib import Path
+from typing import Optional
+
+from dotenv import load_dotenv
+
+from .core import app_base_dir, ensure_env_exists
+from .orchestrator import Orchestrator
+
+
+def default_env_file() -> str:
+    """Default .env location: next to the .exe when frozen, else project root."""
+    return str(app_base_dir() / ".env")
+
+
+def main(env_file: Optional[str] = None) -> None:
+    """
+    Load the environment and run the orchestrator.
+
+    Args:
+        env_file: Path to the .env file; defaults to ``default_env_file()``
+    """
+    env_file = env_file or default_env_file()
+    ensure_env_exists(Path(env_file))
+    load_dotenv(env_file, override=True)
+
+    Orchestrator.from_env().run()
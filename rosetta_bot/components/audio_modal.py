@@ -1,11 +1,9 @@
 """Audio Modal component for handling audio confirmation dialogs."""
 
-import time
-
 from playwright.sync_api import Page
 
-from ..locators import CommonLocators
-from ..core import Timeouts, WaitTimes
+from ..locators import COMMON_LOCATORS
+from ..core import Timeouts
 
 
 class AudioModal:
@@ -26,66 +24,41 @@ class AudioModal:
         """
         self._page = page
         self._debug_enabled = debug_enabled
-        self._locators = CommonLocators()
+        self._locators = COMMON_LOCATORS
+
+        # Locators are lazy and re-resolve on every action, so they are safe
+        # to build once and reuse across calls.
+        self._continue_btn = page.locator(self._locators.AUDIO_MODAL_ANY_CONTINUE).first
 
     def dismiss_if_present(self) -> bool:
         """
         Attempt to dismiss audio confirmation modal if present.
 
-        Tries multiple strategies to find and click the continue button.
+        Waits briefly for any of the modal's continue buttons (one union
+        locator), clicks it and waits for the modal to close.
 
         Returns:
             True if modal was dismissed, False otherwise
         """
-        # Give modal time to appear
-        time.sleep(WaitTimes.VERY_SHORT_WAIT)
+        continue_btn = self._continue_btn
 
-        # Strategy 1: data-qa="PromptButton" (most specific)
-        if self._try_click(self._locators.AUDIO_MODAL_PROMPT_BUTTON, "PromptButton"):
-            return True
-
-        # Strategy 2: Button role with "Continuar" text
         try:
-            continue_btn = self._page.get_by_role("button", name="Continuar")
-            if continue_btn.count() > 0 and continue_btn.first.is_visible():
-                self._log("Audio modal detected (button role), clicking 'Continuar'...")
-                continue_btn.first.click()
-                time.sleep(WaitTimes.SHORT_WAIT)
-                self._log("Audio modal dismissed.")
-                return True
+            continue_btn.wait_for(state="visible", timeout=Timeouts.VERY_SHORT_TIMEOUT)
         except Exception:
-            pass
+            return False
 
-        # Strategy 3: data-qa="continue"
-        if self._try_click(self._locators.AUDIO_MODAL_CONTINUE, "data-qa continue"):
-            return True
-
-        return False
-
-    def _try_click(self, selector: str, description: str) -> bool:
-        """
-        Try to click an element by selector.
-
-        Args:
-            selector: CSS selector
-            description: Description for logging
+        try:
+            self._log("Audio modal detected, clicking 'Continuar'...")
+            continue_btn.click(timeout=Timeouts.VERY_SHORT_TIMEOUT)
+        except Exception:
+            return False
 
-        Returns:
-            True if click successful, False otherwise
-        """
         try:
-            element = self._page.locator(selector)
-            if element.count() > 0 and element.first.is_visible():
-                self._log(
-                    f"Audio modal detected ({description}), clicking 'Continuar'..."
-                )
-                element.first.click()
-                time.sleep(WaitTimes.SHORT_WAIT)
-                self._log("Audio modal dismissed.")
-                return True
+            continue_btn.wait_for(state="hidden", timeout=Timeouts.SHORT_TIMEOUT)
         except Exception:
             pass
-        return False
+        self._log("Audio modal dismissed.")
+        return True
 
     def _log(self, message: str, level: str = "DEBUG") -> None:
         """Log a message with level prefix."""
@@ -2,7 +2,7 @@
 
 from playwright.sync_api import Page
 
-from ..locators import CommonLocators
+from ..locators import COMMON_LOCATORS
 from ..core import Timeouts
 
 
@@ -23,7 +23,19 @@ class CookieConsent:
         """
         self._page = page
         self._debug_enabled = debug_enabled
-        self._locators = CommonLocators()
+        self._locators = COMMON_LOCATORS
+
+        # Accept or close button as one union, so a missing banner costs a
+        # single short wait. Built once and re-resolved by Playwright per click.
+        accept_btn = page.get_by_role("button").filter(
+            has_text=self._locators.COOKIE_ACCEPT_PATTERN
+        )
+        close_btn = page.locator(self._locators.COOKIE_CLOSE_BUTTON)
+        self._dismiss_btn = accept_btn.or_(close_btn).first
+
+        # Consent is stored in the browser context, so once accepted the
+        # banner does not come back for this page's lifetime.
+        self._dismissed = False
 
     def dismiss_if_present(self) -> bool:
         """
@@ -32,27 +44,16 @@ class CookieConsent:
         Returns:
             True if banner was dismissed, False otherwise
         """
-        # Strategy 1: Click accept button by text pattern
-        try:
-            accept_btn = self._page.get_by_role("button").filter(
-                has_text=self._locators.COOKIE_ACCEPT_PATTERN
-            )
-            accept_btn.first.click(timeout=Timeouts.SHORT_TIMEOUT)
-            self._log("Cookie banner accepted.")
-            return True
-        except Exception:
-            pass
+        if self._dismissed:
+            return False
 
-        # Strategy 2: Click close button
         try:
-            close_btn = self._page.locator(self._locators.COOKIE_CLOSE_BUTTON).first
-            close_btn.click(timeout=Timeouts.COOKIE_TIMEOUT)
-            self._log("Cookie banner closed.")
+            self._dismiss_btn.click(timeout=Timeouts.COOKIE_TIMEOUT)
+            self._dismissed = True
+            self._log("Cookie banner dismissed.")
             return True
         except Exception:
-            pass
-
-        return False
+            return False
 
     def _log(self, message: str, level: str = "INFO") -> None:
         """Log a message with level prefix."""
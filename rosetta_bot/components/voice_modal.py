@@ -4,7 +4,7 @@ import time
 
 from playwright.sync_api import Page
 
-from ..locators import CommonLocators
+from ..locators import COMMON_LOCATORS
 from ..core import Timeouts, WaitTimes
 
 
@@ -26,7 +26,12 @@ class VoiceModal:
         """
         self._page = page
         self._debug_enabled = debug_enabled
-        self._locators = CommonLocators()
+        self._locators = COMMON_LOCATORS
+
+        # "Continue without voice" button, reused across calls
+        self._continue_btn = page.get_by_role("button").filter(
+            has_text=self._locators.CONTINUE_WITHOUT_VOICE_PATTERN
+        )
 
     def dismiss_if_present(
         self, wait_for_visible: bool = False, timeout: int = Timeouts.SHORT_TIMEOUT
@@ -42,15 +47,13 @@ class VoiceModal:
             True if modal was dismissed, False otherwise
         """
         try:
-            continue_btn = self._page.get_by_role("button").filter(
-                has_text=self._locators.CONTINUE_WITHOUT_VOICE_PATTERN
-            )
+            continue_btn = self._continue_btn
 
             if wait_for_visible:
                 continue_btn.first.wait_for(state="visible", timeout=timeout)
 
-            if continue_btn.count() > 0:
-                continue_btn.first.click()
+            if continue_btn.first.is_visible():
+                continue_btn.first.click(timeout=Timeouts.VERY_SHORT_TIMEOUT)
                 self._log("'Continue without voice' button clicked.")
                 time.sleep(WaitTimes.VERY_SHORT_WAIT)
                 return True
@@ -60,7 +63,7 @@ class VoiceModal:
 
         return False
 
-    def wait_and_dismiss(self, timeout: int = Timeouts.VERY_LONG_TIMEOUT) -> bool:
+    def wait_and_dismiss(self, timeout: int = Timeouts.LONG_TIMEOUT) -> bool:
         """
         Wait for voice modal and dismiss it.
 
@@ -3,16 +3,16 @@
 import os
 from dataclasses import dataclass
 
-from .core import auth_state_path
+from .core import Timeouts, auth_state_path
 from .exceptions import ConfigurationError
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class BrowserConfig:
     """Configuration for browser settings."""
 
     headless: bool = True
-    slow_mo: int = 500
+    slow_mo: int = 0
     viewport_width: int = 1366
     viewport_height: int = 768
     locale: str = "es-ES"
@@ -23,18 +23,30 @@ class BrowserConfig:
     # Playwright storage_state file: restored on context creation when it
     # exists, written after a successful login. Empty string disables it.
     storage_state_path: str = ""
-
-
-@dataclass
+    # Abort image/font downloads and analytics requests the bot never needs.
+    block_resources: bool = True
+    # Upper bound for a single browser launch attempt, in milliseconds.
+    launch_timeout_ms: int = 30000
+    # Context-wide defaults for actions/waits and for navigations; calls
+    # that pass no timeout= use these.
+    default_timeout_ms: int = Timeouts.DEFAULT
+    nav_timeout_ms: int = Timeouts.VERY_LONG
+    # How long lesson entry waits for the "continue without voice" modal.
+    voice_modal_timeout_ms: int = Timeouts.LONG
+
+
+@dataclass(frozen=True, slots=True)
 class AppConfig:
     """Main application configuration."""
 
     email: str
     password: str
     browser: BrowserConfig
-    debug_enabled: bool = True
+    debug_enabled: bool = False
     lesson_name: str = "A Visit to Hollywood|Una visita a Hollywood"
     target_hours: float = 35.0
+    # Rosetta Stone interface language: "en", "es" or "auto" (either)
+    ui_language: str = "auto"
 
     @classmethod
     def from_env(cls) -> "AppConfig":
@@ -50,13 +62,31 @@ class AppConfig:
         headless_env = os.getenv("BROWSER_HEADLESS", "1")
         headless = headless_env.lower() not in ("0", "false", "no")
 
-        slow_mo = int(os.getenv("BROWSER_SLOW_MO", "500"))
-        debug_enabled = os.getenv("DEBUG", "1").lower() not in ("0", "false", "no")
+        debug_enabled = os.getenv("DEBUG", "0").lower() not in ("0", "false", "no")
+        # slow_mo delays every browser action; only slow down debug runs
+        slow_mo = int(os.getenv("BROWSER_SLOW_MO", "500" if debug_enabled else "0"))
+        block_env = os.getenv("BROWSER_BLOCK_RESOURCES", "1")
+        block_resources = block_env.lower() not in ("0", "false", "no")
+        launch_timeout_ms = int(os.getenv("BROWSER_LAUNCH_TIMEOUT_MS", "30000"))
+        default_timeout_ms = int(
+            os.getenv("BROWSER_TIMEOUT_MS", str(Timeouts.DEFAULT))
+        )
+        nav_timeout_ms = int(
+            os.getenv("BROWSER_NAV_TIMEOUT_MS", str(Timeouts.VERY_LONG))
+        )
+        voice_modal_timeout_ms = int(
+            os.getenv("VOICE_MODAL_TIMEOUT_MS", str(Timeouts.LONG))
+        )
 
         browser_config = BrowserConfig(
             headless=headless,
             slow_mo=slow_mo,
             storage_state_path=str(auth_state_path(email)),
+            block_resources=block_resources,
+            launch_timeout_ms=launch_timeout_ms,
+            default_timeout_ms=default_timeout_ms,
+            nav_timeout_ms=nav_timeout_ms,
+            voice_modal_timeout_ms=voice_modal_timeout_ms,
         )
 
         lesson_name = os.getenv(
@@ -65,6 +95,12 @@ class AppConfig:
 
         target_hours = float(os.getenv("TARGET_HOURS", "35.0"))
 
+        ui_language = os.getenv("ROSETTA_LOCALE", "auto").lower()
+        if ui_language not in ("auto", "en", "es"):
+            raise ConfigurationError(
+                f"ROSETTA_LOCALE must be 'auto', 'en' or 'es', got {ui_language!r}"
+            )
+
         return cls(
             email=email,
             password=password,
@@ -72,4 +108,5 @@ class AppConfig:
             debug_enabled=debug_enabled,
             lesson_name=lesson_name,
             target_hours=target_hours,
+            ui_language=ui_language,
         )
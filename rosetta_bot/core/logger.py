@@ -1,8 +1,9 @@
 """Centralized logging service."""
 
+import logging
+import sys
+import time
 from enum import Enum
-from typing import Optional
-from datetime import datetime
 
 
 class LogLevel(Enum):
@@ -14,27 +15,82 @@ class LogLevel(Enum):
     LOOP = "LOOP"
 
 
+# Standard logging levels for each LogLevel; LOOP sits between DEBUG and INFO.
+_LEVEL_NUMBERS = {
+    LogLevel.DEBUG: logging.DEBUG,
+    LogLevel.LOOP: 15,
+    LogLevel.INFO: logging.INFO,
+    LogLevel.WARN: logging.WARNING,
+    LogLevel.ERROR: logging.ERROR,
+}
+logging.addLevelName(_LEVEL_NUMBERS[LogLevel.LOOP], LogLevel.LOOP.value)
+
+# "[LEVEL]" prefixes, built once instead of on every call
+_LEVEL_PREFIXES = {level: f"[{level.value}]" for level in LogLevel}
+
+# [epoch second, "HH:MM:SS"] of the last timestamp rendered
+_ts_cache = [0, ""]
+
+
+def _timestamp(created: float) -> str:
+    """Return "HH:MM:SS" for a record time, formatting once per second."""
+    now = int(created)
+    if now != _ts_cache[0]:
+        _ts_cache[0] = now
+        _ts_cache[1] = time.strftime("%H:%M:%S", time.localtime(now))
+    return _ts_cache[1]
+
+
+class _LineFormatter(logging.Formatter):
+    """Render records as "[HH:MM:SS ]<prefix> message"."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        # One f-string per line; no intermediate concatenations
+        prefix = getattr(record, "prefix", "")
+        if getattr(record, "show_timestamp", False):
+            return f"{_timestamp(record.created)} {prefix}{record.msg}"
+        return f"{prefix}{record.msg}"
+
+
+class _StdoutHandler(logging.StreamHandler):
+    """Stream handler that leaves DEBUG/LOOP lines in the stream buffer.
+
+    Chatty loop output is flushed together with the next INFO-or-higher
+    record (or at interpreter exit) instead of one flush per line.
+    """
+
+    def emit(self, record: logging.LogRecord) -> None:
+        try:
+            self.stream.write(self.format(record) + self.terminator)
+            if record.levelno >= logging.INFO:
+                self.flush()
+        except Exception:
+            self.handleError(record)
+
+
+_handler = _StdoutHandler(sys.stdout)
+_handler.setFormatter(_LineFormatter())
+
+_root = logging.getLogger("rosetta_bot")
+_root.addHandler(_handler)
+_root.setLevel(logging.DEBUG)
+_root.propagate = False
+
+
 class Logger:
     """
     Centralized logging service.
     
     Provides consistent logging across all modules with optional
-    timestamps and configurable log levels.
+    timestamps and configurable log levels. Backed by the standard
+    ``logging`` module (logger ``rosetta_bot.<name>``), so formatting only
+    runs for records that pass the level check.
     
     Attributes:
         name: Logger name (usually module/class name)
         show_timestamp: Whether to include timestamps in logs
         min_level: Minimum log level to display
     """
-    
-    # Class-level log level priority
-    _LEVEL_PRIORITY = {
-        LogLevel.DEBUG: 0,
-        LogLevel.LOOP: 1,
-        LogLevel.INFO: 2,
-        LogLevel.WARN: 3,
-        LogLevel.ERROR: 4,
-    }
 
     def __init__(
         self,
@@ -53,6 +109,18 @@ class Logger:
         self._name = name
         self._show_timestamp = show_timestamp
         self._min_level = min_level
+        self._min_number = _LEVEL_NUMBERS[min_level]
+        self._logger = logging.getLogger(f"rosetta_bot.{name}" if name else "rosetta_bot")
+
+        # Per-level record extras, so log() does no string building
+        name_part = f" [{name}]" if name else ""
+        self._extras = {
+            level: {
+                "prefix": f"{prefix}{name_part} ",
+                "show_timestamp": show_timestamp,
+            }
+            for level, prefix in _LEVEL_PREFIXES.items()
+        }
 
     def log(self, message: str, level: LogLevel = LogLevel.INFO) -> None:
         """
@@ -62,22 +130,10 @@ class Logger:
             message: Message to log
             level: Log level
         """
-        if self._LEVEL_PRIORITY[level] < self._LEVEL_PRIORITY[self._min_level]:
+        number = _LEVEL_NUMBERS[level]
+        if number < self._min_number:
             return
-        
-        parts = []
-        
-        if self._show_timestamp:
-            parts.append(datetime.now().strftime("%H:%M:%S"))
-        
-        parts.append(f"[{level.value}]")
-        
-        if self._name:
-            parts.append(f"[{self._name}]")
-        
-        parts.append(message)
-        
-        print(" ".join(parts))
+        self._logger.log(number, message, extra=self._extras[level])
 
     def debug(self, message: str) -> None:
         """Log a debug message."""
@@ -32,6 +32,10 @@ class Timeouts:
     VERY_LONG: int = 60000
     VERY_LONG_TIMEOUT: int = 60000
 
+    # Per-frame probes (scanning every frame for one element)
+    FRAME_PROBE: int = 500
+    FRAME_PROBE_TIMEOUT: int = 500
+
     # Cookie banner specific
     COOKIE: int = 2000
     COOKIE_TIMEOUT: int = 2000
@@ -23,5 +23,6 @@ class WaitTimes:
     MEDIUM: float = 10.0
     MEDIUM_WAIT: float = 10.0
 
-    # Activity cycle (audio playback)
+    # Activity cycle (audio playback). An upper bound for waiting on the
+    # audio to end, not a fixed sleep: pass it to wait_for_playback_end().
     ACTIVITY_CYCLE: float = 50.0
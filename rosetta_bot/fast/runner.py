@@ -33,6 +33,7 @@ import random
 import time
 import uuid
 from typing import Optional
+from urllib.parse import urlparse
 
 from playwright.async_api import async_playwright, Playwright
 
@@ -47,7 +48,7 @@ from ..core import (
     is_kmsi_prompt,
     is_login_url,
 )
-from ..locators import StoriesLocators
+from ..locators import LaunchpadLocators, LoginLocators, StoriesLocators
 from .config import FastReportConfig
 from .dashboard import DashboardReader
 from .result import FastReportResult
@@ -70,6 +71,7 @@ class FastStoriesRunner:
         self._api = UsageApiClient(config.user_agent)
         self._dashboard = DashboardReader()
         self._locators = StoriesLocators()
+        self._login_locators = LoginLocators()
         # Times each story has been claimed by a session, keyed by story name.
         # Sessions pick the least-claimed story so they spread across stories
         # instead of all piling onto the first visible one.
@@ -210,6 +212,10 @@ class FastStoriesRunner:
             "--disable-renderer-backgrounding",
             "--disable-backgrounding-occluded-windows",
         ]
+        # Resolve the login/app hosts while Chromium boots so the first
+        # navigation does not pay DNS latency on top of the cold start.
+        dns_warmup = asyncio.create_task(self._prewarm_dns())
+
         # Prefer a system browser (chrome -> msedge -> bundled Chromium) so a
         # packaged .exe needs no `playwright install`.
         browser = None
@@ -222,6 +228,7 @@ class FastStoriesRunner:
                 break
             except Exception as exc:
                 last_error = exc
+        await dns_warmup
         if browser is None:
             raise RuntimeError(
                 "Could not launch a browser. Install Chrome/Edge or run "
@@ -240,6 +247,15 @@ class FastStoriesRunner:
 
         return browser, sessions
 
+    async def _prewarm_dns(self) -> None:
+        """Resolve the hosts the sessions will hit first; best-effort."""
+        loop = asyncio.get_running_loop()
+        hosts = {urlparse(url).hostname for url in (URLs.LOGIN, URLs.STORIES, URLs.LCP_BASE)}
+        await asyncio.gather(
+            *(loop.getaddrinfo(host, 443) for host in hosts),
+            return_exceptions=True,
+        )
+
     async def _login_and_setup(
         self, browser, session_id: int, shared_auth: dict
     ) -> Optional[dict]:
@@ -300,12 +316,10 @@ class FastStoriesRunner:
                 await self._dismiss_cookie_banner(page)
 
                 await self._fill_first(
-                    page,
-                    ["input[type='email']", "input[autocomplete='email']", "input[name='email']"],
-                    cfg.email,
+                    page, self._login_locators.EMAIL_ANY_SELECTORS, cfg.email
                 )
                 pw_field = await self._fill_first(
-                    page, ["input[type='password']", "input[name='password']"], cfg.password
+                    page, self._login_locators.PASSWORD_SELECTORS, cfg.password
                 )
                 if pw_field:
                     await asyncio.sleep(1)
@@ -504,15 +518,15 @@ class FastStoriesRunner:
 
     # ==================== Helpers ====================
 
-    async def _fill_first(self, page, selectors, value):
-        for sel in selectors:
-            try:
-                field = page.locator(sel).first
-                if await field.is_visible(timeout=2000):
-                    await field.fill(value)
-                    return field
-            except Exception:
-                continue
+    async def _fill_first(self, page, selector: str, value):
+        # selector is a CSS union, resolved in a single query
+        try:
+            field = page.locator(selector).first
+            if await field.is_visible(timeout=2000):
+                await field.fill(value)
+                return field
+        except Exception:
+            pass
         return None
 
     async def _click_first_button(self, page, labels, timeout: int) -> bool:
@@ -538,17 +552,19 @@ class FastStoriesRunner:
 
     async def _handle_institutional_account(self, page, tag: str) -> None:
         try:
-            content = await page.content()
-            if "uleam" not in content.lower():
+            # Match in the live DOM instead of shipping page.content() over CDP
+            el = page.get_by_text(
+                self._login_locators.INSTITUTIONAL_ACCOUNT_NAME, exact=False
+            ).first
+            if not await el.is_visible():
                 return
             self._logger.info(f"{tag} Selecting institutional account...")
-            el = page.get_by_text("uleam", exact=False).first
-            if not await el.is_visible(timeout=5000):
-                return
             await el.click()
             await asyncio.sleep(3)
             await self._wait_idle(page, 10000)
-            pw2 = await self._fill_first(page, ["input[type='password']"], self._config.password)
+            pw2 = await self._fill_first(
+                page, self._login_locators.PASSWORD_SELECTORS, self._config.password
+            )
             if pw2:
                 await asyncio.sleep(1)
                 await pw2.press("Enter")
@@ -566,27 +582,19 @@ class FastStoriesRunner:
             return
 
         try:
-            checkbox = page.locator("#KmsiCheckboxField").first
+            checkbox = page.locator(self._login_locators.KMSI_CHECKBOX).first
             if await checkbox.is_visible(timeout=1500):
                 await checkbox.check()
         except Exception:
             pass
 
-        for selector in (
-            "#idSIButton9",
-            "input[type='submit'][value='Yes']",
-            "input[type='submit'][value='Sí']",
-            "button:has-text('Yes')",
-            "button:has-text('Sí')",
-        ):
-            try:
-                btn = page.locator(selector).first
-                if await btn.is_visible(timeout=1500):
-                    await btn.click()
-                    await asyncio.sleep(2)
-                    return
-            except Exception:
-                continue
+        try:
+            btn = page.locator(self._login_locators.KMSI_ACCEPT_BUTTON).first
+            if await btn.is_visible(timeout=1500):
+                await btn.click()
+                await asyncio.sleep(2)
+        except Exception:
+            pass
 
     async def _ensure_authenticated(self, page, tag: str) -> None:
         """
@@ -616,9 +624,7 @@ class FastStoriesRunner:
     async def _authenticate_totale(self, page, tag: str) -> None:
         self._logger.info(f"{tag} Authenticating with totale...")
         try:
-            el = page.get_by_text("Foundations", exact=False).first
-            if not await el.is_visible(timeout=3000):
-                el = page.get_by_text("Fundamentos", exact=False).first
+            el = page.get_by_text(LaunchpadLocators.FOUNDATIONS_PATTERN).first
             await el.click()
             await asyncio.sleep(8)
             await self._wait_idle(page, 20000)
@@ -649,10 +655,7 @@ class FastStoriesRunner:
         candidates = await self._discover_stories(page)
         if not candidates:
             self._logger.warn(f"{tag} No story tiles found, falling back to known names")
-            candidates = [
-                (name, page.get_by_text(name, exact=True).first)
-                for name in self._locators.KNOWN_STORIES
-            ]
+            candidates = await self._discover_known_stories(page)
 
         candidates.sort(key=lambda c: self._story_claims.get(c[0], 0))
 
@@ -670,19 +673,21 @@ class FastStoriesRunner:
 
     async def _discover_stories(self, page) -> list:
         """Return [(story_name, locator)] for every story tile on the page."""
-        stories = []
-        seen = set()
+        titles = page.locator(self._locators.STORY_TITLE)
         try:
-            titles = page.locator(self._locators.STORY_TITLE)
             texts = await titles.all_inner_texts()
-            for i, text in enumerate(texts):
-                name = text.strip()
-                if name and name not in seen:
-                    seen.add(name)
-                    stories.append((name, titles.nth(i)))
         except Exception:
-            pass
-        return stories
+            return []
+        return self._locators.story_matches(texts, titles)
+
+    async def _discover_known_stories(self, page) -> list:
+        """Return [(story_name, locator)] for known names, in one text query."""
+        matches = page.get_by_text(self._locators.KNOWN_STORIES_PATTERN)
+        try:
+            texts = await matches.all_inner_texts()
+        except Exception:
+            return []
+        return self._locators.story_matches(texts, matches)
 
     async def _collect_cookies(self, context) -> str:
         cookies_list = await context.cookies()
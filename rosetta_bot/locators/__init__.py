@@ -4,7 +4,7 @@ from .login_locators import LoginLocators
 from .stories_locators import StoriesLocators
 from .lesson_locators import LessonLocators
 from .launchpad_locators import LaunchpadLocators
-from .common_locators import CommonLocators
+from .common_locators import COMMON_LOCATORS, CommonLocators
 
 __all__ = [
     "LoginLocators",
@@ -12,4 +12,5 @@ __all__ = [
     "LessonLocators",
     "LaunchpadLocators",
     "CommonLocators",
+    "COMMON_LOCATORS",
 ]
@@ -0,0 +1,11 @@
+"""Shared, interned regex compilation for the locator modules."""
+
+import re
+from functools import lru_cache
+from typing import Pattern
+
+
+@lru_cache(maxsize=256)
+def compile_ci(pattern: str) -> Pattern[str]:
+    """Compile a case-insensitive pattern, reusing an identical earlier one."""
+    return re.compile(pattern, re.IGNORECASE)
@@ -1,13 +1,9 @@
 """Common locators shared across multiple pages."""
 
-import re
 from dataclasses import dataclass
 from typing import Pattern
 
-
-def _compile_pattern(pattern: str) -> Pattern[str]:
-    """Compile a regex pattern with case-insensitive flag."""
-    return re.compile(pattern, re.IGNORECASE)
+from ._regex_cache import compile_ci
 
 
 @dataclass(frozen=True)
@@ -17,21 +13,33 @@ class CommonLocators:
     # Audio modal
     AUDIO_MODAL_PROMPT_BUTTON: str = '[data-qa="PromptButton"]'
     AUDIO_MODAL_CONTINUE: str = '[data-qa="continue"]'
+    AUDIO_MODAL_ANY_CONTINUE: str = (
+        '[data-qa="PromptButton"], [data-qa="continue"], '
+        'button:has-text("Continuar")'
+    )
 
     # Generic buttons
-    CONTINUE_BUTTON_PATTERN: Pattern[str] = _compile_pattern(r"Continuar|Continue")
+    CONTINUE_BUTTON_PATTERN: Pattern[str] = compile_ci(r"Continuar|Continue")
 
     # Cookie consent
     COOKIE_CLOSE_BUTTON: str = "button[aria-label='Close'], [data-testid='close']"
-    COOKIE_ACCEPT_PATTERN: Pattern[str] = _compile_pattern(
-        r"accept|agree|allow|ok|got\s*it|entendido|acept(ar|o)|permit(ir|o)|de\s*acuerdo"
+    COOKIE_ACCEPT_PATTERN: Pattern[str] = compile_ci(
+        r"\b(accept|agree|allow|got\s*it|entendido|acept(ar|o)|permit(ir|o)"
+        r"|de\s*acuerdo)\b"
     )
 
     # Voice modal
-    CONTINUE_WITHOUT_VOICE_PATTERN: Pattern[str] = _compile_pattern(
+    CONTINUE_WITHOUT_VOICE_PATTERN: Pattern[str] = compile_ci(
         r"continuar\s+sin\s+voz|continue\s+without\s+(voice|speech)"
     )
 
     # Mode selection
-    LISTEN_PATTERN: Pattern[str] = _compile_pattern(r"escuchar|listen")
-    READ_PATTERN: Pattern[str] = _compile_pattern(r"leer|read")
+    LISTEN_PATTERN: Pattern[str] = compile_ci(r"\b(escuchar|listen)\b")
+    READ_PATTERN: Pattern[str] = compile_ci(r"\b(leer|read)\b")
+    LISTEN_TEXT_EN: str = "Listen"
+    LISTEN_TEXT_ES: str = "Escuchar"
+
+
+# Shared instance: the locators are immutable, so every component uses this
+# one instead of constructing its own.
+COMMON_LOCATORS = CommonLocators()
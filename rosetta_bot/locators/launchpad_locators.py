@@ -1,13 +1,9 @@
 """Locators for the Launchpad page."""
 
-import re
 from dataclasses import dataclass
 from typing import Pattern
 
-
-def _compile_pattern(pattern: str) -> Pattern[str]:
-    """Compile a regex pattern with case-insensitive flag."""
-    return re.compile(pattern, re.IGNORECASE)
+from ._regex_cache import compile_ci
 
 
 @dataclass(frozen=True)
@@ -18,10 +14,12 @@ class LaunchpadLocators:
     LAUNCHPAD_URL: str = "https://login.rosettastone.com/launchpad"
 
     # Foundations section
-    FOUNDATIONS_PATTERN: Pattern[str] = _compile_pattern(r"foundations|fundamentos")
+    FOUNDATIONS_PATTERN: Pattern[str] = compile_ci(r"foundations|fundamentos")
+    FOUNDATIONS_TEXT_EN: str = "Foundations"
+    FOUNDATIONS_TEXT_ES: str = "Fundamentos"
 
     # Browse content
-    BROWSE_CONTENT_PATTERN: Pattern[str] = _compile_pattern(
+    BROWSE_CONTENT_PATTERN: Pattern[str] = compile_ci(
         r"^(explorar\s+todo\s+el\s+contenido|browse\s+all\s+content|explore\s+all\s+content)$"
     )
 
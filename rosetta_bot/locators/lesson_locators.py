@@ -1,13 +1,9 @@
 """Locators for the Lesson page."""
 
-import re
 from dataclasses import dataclass
 from typing import Pattern
 
-
-def _compile_pattern(pattern: str) -> Pattern[str]:
-    """Compile a regex pattern with case-insensitive flag."""
-    return re.compile(pattern, re.IGNORECASE)
+from ._regex_cache import compile_ci
 
 
 @dataclass(frozen=True)
@@ -22,15 +18,15 @@ class LessonLocators:
     REWIND_TEXT: str = "10"
 
     # Lesson completion indicators
-    COMPLETION_PATTERN: Pattern[str] = _compile_pattern(
+    COMPLETION_PATTERN: Pattern[str] = compile_ci(
         r"Completado|Completed|Terminado"
     )
-    NEXT_LESSON_PATTERN: Pattern[str] = _compile_pattern(
+    NEXT_LESSON_PATTERN: Pattern[str] = compile_ci(
         r"Siguiente lección|Next lesson"
     )
-    CONTINUE_PATTERN: Pattern[str] = _compile_pattern(r"Continuar|Continue")
+    CONTINUE_PATTERN: Pattern[str] = compile_ci(r"Continuar|Continue")
 
     # Restart controls
-    RESTART_PATTERN: Pattern[str] = _compile_pattern(
+    RESTART_PATTERN: Pattern[str] = compile_ci(
         r"Repetir|Replay|Reiniciar|Restart"
     )
@@ -1,13 +1,9 @@
 """Locators for the Login page."""
 
-import re
 from dataclasses import dataclass
-from typing import Pattern, List
+from typing import Pattern
 
-
-def _compile_pattern(pattern: str) -> Pattern[str]:
-    """Compile a regex pattern with case-insensitive flag."""
-    return re.compile(pattern, re.IGNORECASE)
+from ._regex_cache import compile_ci
 
 
 @dataclass(frozen=True)
@@ -27,6 +23,9 @@ class LoginLocators:
         "input[type='text'][name='email'], "
         "input[type='text'][autocomplete='username']"
     )
+    # Primary and fallback email selectors in one union: a single query
+    # per frame instead of a second full scan when the primary misses.
+    EMAIL_ANY_SELECTORS: str = f"{EMAIL_SELECTORS}, {EMAIL_FALLBACK_SELECTORS}"
 
     # Password field selectors
     PASSWORD_SELECTORS: str = (
@@ -37,22 +36,37 @@ class LoginLocators:
 
     # Submit button selectors
     SUBMIT_BUTTON: str = "[data-qa='SignInButton'], button[type='submit']"
+    SUBMIT_FALLBACK: str = "button[type='submit'], input[type='submit']"
 
     # Sign in button patterns
-    SIGNIN_PATTERN: Pattern[str] = _compile_pattern(
+    SIGNIN_PATTERN: Pattern[str] = compile_ci(
         r"sign\s*in|iniciar\s*sesión|acceder|entrar|login"
     )
 
     # Login page detection patterns
-    LOGIN_PAGE_PATTERN: Pattern[str] = _compile_pattern(
+    LOGIN_PAGE_PATTERN: Pattern[str] = compile_ci(
         r"login|signin|acceder|entrar|iniciar"
     )
 
-    # Institutional account selectors
-    INSTITUTIONAL_SELECTORS: List[str] = (
-        "text=uleam",
-        "[data-testid*='uleam']",
-        "button:has-text('uleam')",
-        "div:has-text('uleam')",
-        "span:has-text('uleam')",
+    # Microsoft "Stay signed in?" (KMSI) prompt. The accept selectors are a
+    # single CSS union so the prompt is probed in one query.
+    KMSI_CHECKBOX: str = "#KmsiCheckboxField"
+    KMSI_ACCEPT_BUTTON: str = (
+        "#idSIButton9, input[type='submit'][value='Yes'], "
+        "input[type='submit'][value='Sí'], button:has-text('Yes'), "
+        "button:has-text('Sí')"
+    )
+
+    # Institutional account name shown on the Microsoft account picker
+    INSTITUTIONAL_ACCOUNT_NAME: str = "uleam"
+
+    # Institutional account picker, as one union so it resolves in a single
+    # query. :text() already matches the innermost div/span holding the name.
+    INSTITUTIONAL_ACCOUNT: str = (
+        ":text('uleam'), [data-testid*='uleam'], button:has-text('uleam')"
+    )
+
+    # Institutional login page detection pattern
+    INSTITUTIONAL_PATTERN: Pattern[str] = compile_ci(
+        r"uleam|universidad|institution"
     )
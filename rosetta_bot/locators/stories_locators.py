@@ -2,12 +2,12 @@
 
 import re
 from dataclasses import dataclass
-from typing import Pattern, List
+from typing import Iterable, List, Pattern, Tuple, TypeVar
 
+from ._regex_cache import compile_ci
 
-def _compile_pattern(pattern: str) -> Pattern[str]:
-    """Compile a regex pattern with case-insensitive flag."""
-    return re.compile(pattern, re.IGNORECASE)
+# Sync or async Playwright Locator
+_Locator = TypeVar("_Locator")
 
 
 @dataclass(frozen=True)
@@ -25,16 +25,17 @@ class StoriesLocators:
     STORY_TITLE: str = ".text-fit-inner"
 
     # Story detection patterns
-    STORIES_SECTION_PATTERN: Pattern[str] = _compile_pattern(r"^historias$|^stories$")
+    STORIES_SECTION_PATTERN: Pattern[str] = compile_ci(r"^historias$|^stories$")
 
     # Completion indicators
-    COMPLETION_PATTERN: Pattern[str] = _compile_pattern(
+    COMPLETION_PATTERN: Pattern[str] = compile_ci(
         r"completado|completed|finalizado|finished"
     )
-    NEXT_STORY_PATTERN: Pattern[str] = _compile_pattern(r"siguiente|next")
+    NEXT_STORY_PATTERN: Pattern[str] = compile_ci(r"siguiente|next")
 
-    # Known story names for Unit 1
-    KNOWN_STORIES: List[str] = (
+    # Known story names for Unit 1. A tuple: built once with the class and
+    # shared by every instance, never copied on access.
+    KNOWN_STORIES: Tuple[str, ...] = (
         "A Man Is Walking",
         "Driving",
         "Maria and Rob: The Cat in the Tree",
@@ -48,6 +49,37 @@ class StoriesLocators:
         "Hello from San Francisco",
         "A Visit to Hollywood",
     )
+    # Every known name as one anchored alternation, so the fallback search
+    # is a single text query instead of one query per name.
+    KNOWN_STORIES_PATTERN: Pattern[str] = compile_ci(
+        "^(?:" + "|".join(map(re.escape, KNOWN_STORIES)) + ")$"
+    )
+
+    @staticmethod
+    def story_matches(
+        texts: Iterable[str], matches: _Locator
+    ) -> List[Tuple[str, _Locator]]:
+        """
+        Pair each distinct story name with its match of a locator.
+
+        The texts come from the caller's own all_inner_texts() call, so the
+        sync page objects and the async fast runner share this one function.
+
+        Args:
+            texts: Inner texts of every match, in document order
+            matches: Locator the texts were read from
+
+        Returns:
+            List of (story_name, locator) tuples, first occurrence of a name only
+        """
+        stories = []
+        seen = set()
+        for i, text in enumerate(texts):
+            name = text.strip()
+            if name and name not in seen:
+                seen.add(name)
+                stories.append((name, matches.nth(i)))
+        return stories
 
     # Audio player controls
     PLAY_BUTTON: str = "polygon"
@@ -18,9 +18,6 @@ import asyncio
 import os
 from typing import Optional
 
-from playwright.sync_api import sync_playwright
-
-from .bot import RosettaStoneBot
 from .config import AppConfig
 from .core import Logger, get_logger
 from .fast import FastReportConfig, FastReportResult, FastStoriesRunner
@@ -78,12 +75,21 @@ class Orchestrator:
         return False
 
     def _run_fallback_bot(self) -> None:
+        # Imported here so runs the fast path satisfies never load the sync
+        # Playwright API or the bot's pages and workflows.
+        from playwright.sync_api import sync_playwright
+
+        from .bot import RosettaStoneBot
+
         config = AppConfig.from_env()
         with sync_playwright() as playwright:
             bot = RosettaStoneBot(config)
-            if self._fallback_mode == "lesson":
-                self._logger.info("Fallback: running infinite lesson loop...")
-                bot.run_infinite_lesson_loop(playwright)
-            else:
-                self._logger.info("Fallback: running infinite stories loop...")
-                bot.run_infinite_stories_loop(playwright)
+            try:
+                if self._fallback_mode == "lesson":
+                    self._logger.info("Fallback: running infinite lesson loop...")
+                    bot.run_infinite_lesson_loop(playwright)
+                else:
+                    self._logger.info("Fallback: running infinite stories loop...")
+                    bot.run_infinite_stories_loop(playwright)
+            finally:
+                bot.shutdown()
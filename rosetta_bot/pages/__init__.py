@@ -1,10 +1,31 @@
 """Page Objects following Page Object Model pattern."""
 
-from .base_page import BasePage
-from .login_page import LoginPage
-from .launchpad_page import LaunchpadPage
-from .stories_page import StoriesPage
-from .lesson_page import LessonPage
+from importlib import import_module
+
+# Page objects are imported on first access (PEP 562), so importing
+# LoginPage does not also load the stories and lesson pages.
+_EXPORTS = {
+    "BasePage": ".base_page",
+    "LoginPage": ".login_page",
+    "LaunchpadPage": ".launchpad_page",
+    "StoriesPage": ".stories_page",
+    "LessonPage": ".lesson_page",
+}
+
+
+def __getattr__(name: str):
+    """Import a page object from its module on first access."""
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(list(globals()) + list(_EXPORTS))
+
 
 __all__ = [
     "BasePage",
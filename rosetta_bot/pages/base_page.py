@@ -1,15 +1,25 @@
 """Base Page class implementing common Page Object Model functionality."""
 
+import random
 import time
 from typing import Optional, Callable
 from abc import ABC
 
-from playwright.sync_api import Page, Locator, Frame
+from playwright.sync_api import Dialog, Page, Locator, Frame
 
 from ..core import Timeouts, WaitTimes
 from ..services import DebugService
 
 
+def _dismiss_dialog(dialog: Dialog) -> None:
+    """Dismiss a JavaScript dialog (page "dialog" event handler)."""
+    dialog.dismiss()
+
+
+def _skip_screenshot(name: str) -> None:
+    """Stand-in for BasePage.take_screenshot when debugging is disabled."""
+
+
 class BasePage(ABC):
     """
     Abstract base class for all Page Objects.
@@ -30,6 +40,11 @@ class BasePage(ABC):
         self._debug_enabled = debug_enabled
         self._debug = DebugService(page, enabled=debug_enabled)
 
+        # With debugging off every take_screenshot() call site becomes a no-op
+        # without each one checking the flag.
+        if not debug_enabled:
+            self.take_screenshot = _skip_screenshot
+
     @property
     def page(self) -> Page:
         """Get the Playwright page object."""
@@ -79,6 +94,21 @@ class BasePage(ABC):
         """
         self._page.wait_for_load_state(state, timeout=timeout)
 
+    def settle(self, timeout: int = Timeouts.DEFAULT_TIMEOUT) -> None:
+        """
+        Wait for the network to go idle after an in-page action.
+
+        Returns as soon as the page is idle instead of sleeping a fixed time;
+        never raises.
+
+        Args:
+            timeout: Upper bound in milliseconds
+        """
+        try:
+            self._page.wait_for_load_state("networkidle", timeout=timeout)
+        except Exception:
+            pass
+
     # ==================== Element Interactions ====================
 
     def click_safe(
@@ -116,7 +146,7 @@ class BasePage(ABC):
             locator.click(timeout=timeout, force=force)
             return True
         except Exception as e:
-            self._log(f"Click failed: {e}", level="WARN")
+            self._log("Click failed: %s", e, level="WARN")
             return False
 
     def fill_safe(
@@ -138,7 +168,7 @@ class BasePage(ABC):
             locator.fill(text)
             return True
         except Exception as e:
-            self._log(f"Fill failed: {e}", level="WARN")
+            self._log("Fill failed: %s", e, level="WARN")
             return False
 
     def is_visible(
@@ -216,19 +246,24 @@ class BasePage(ABC):
         Returns:
             Locator if found, None otherwise
         """
-        # Try main page first
+        # Try main page first; one query covers the whole selector union.
+        # is_visible() checks the current DOM and returns at once, so a frame
+        # without the element costs one query, not a timeout.
+        main_frame = self._page.main_frame
         try:
             loc = self._page.locator(selector).first
-            if loc.is_visible(timeout=Timeouts.SHORT_TIMEOUT):
+            if loc.is_visible():
                 return loc
         except Exception:
             pass
 
-        # Try frames
+        # Try child frames (page.frames also lists the main frame)
         for frame in self._page.frames:
+            if frame is main_frame or frame.is_detached():
+                continue
             try:
                 floc = frame.locator(selector).first
-                if floc.is_visible(timeout=Timeouts.SHORT_TIMEOUT):
+                if floc.is_visible():
                     return floc
             except Exception:
                 continue
@@ -259,40 +294,69 @@ class BasePage(ABC):
         """Take a debug screenshot if debugging is enabled."""
         self._debug.dump(name)
 
-    def _log(self, message: str, level: str = "INFO") -> None:
-        """Log a message with level prefix."""
+    def _log(self, message: str, *args: object, level: str = "INFO") -> None:
+        """
+        Log a message with level prefix.
+
+        The message is %-formatted only when args are given.
+        """
+        if args:
+            message = message % args
         print(f"[{level}] {message}")
 
     # ==================== Dialog Handling ====================
 
     def setup_dialog_auto_dismiss(self) -> None:
         """Configure dialogs to be automatically dismissed."""
-        self._page.on("dialog", lambda dialog: dialog.dismiss())
+        # One shared handler: re-registering replaces it instead of stacking
+        # a second listener that would dismiss the same dialog twice.
+        self._page.remove_listener("dialog", _dismiss_dialog)
+        self._page.on("dialog", _dismiss_dialog)
 
     # ==================== Retry Logic ====================
 
     def retry_action(
-        self, action: Callable[[], bool], max_retries: int = 3, delay: float = 1.0
+        self,
+        action: Callable[[], bool],
+        max_retries: int = 3,
+        delay: float = 1.0,
+        max_delay: float = 30.0,
+        jitter: float = 0.5,
     ) -> bool:
         """
         Retry an action with exponential backoff.
 
+        Stops at the first success, and gives up immediately once the page
+        has been closed since retrying can no longer help.
+
         Args:
             action: Callable that returns True on success
             max_retries: Maximum number of retries
             delay: Initial delay between retries in seconds
+            max_delay: Upper bound for a single delay in seconds
+            jitter: Fraction of each delay that is randomized (0 to 1)
 
         Returns:
             True if action succeeded, False after all retries failed
         """
-        for attempt in range(max_retries):
-            try:
-                if action():
-                    return True
-            except Exception as e:
-                self._log(f"Attempt {attempt + 1} failed: {e}", level="WARN")
+        if max_retries < 1:
+            return False
+
+        # Sleeps between attempts only; the last attempt is never followed by one
+        backoffs = [min(max_delay, delay * 2**i) for i in range(max_retries - 1)]
+        for attempt, backoff in enumerate(backoffs):
+            if self._attempt(action, attempt):
+                return True
+            if self._page.is_closed():
+                return False
+            time.sleep(backoff * random.uniform(1 - jitter, 1))
 
-            if attempt < max_retries - 1:
-                time.sleep(delay * (attempt + 1))
+        return self._attempt(action, max_retries - 1)
 
-        return False
+    def _attempt(self, action: Callable[[], bool], attempt: int) -> bool:
+        """Run one retry_action attempt, logging instead of raising."""
+        try:
+            return bool(action())
+        except Exception as e:
+            self._log("Attempt %d failed: %s", attempt + 1, e, level="WARN")
+            return False
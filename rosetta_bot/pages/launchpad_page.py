@@ -1,13 +1,16 @@
 """Launchpad Page Object for navigation and course selection."""
 
 import os
+import re
 import time
+from typing import Dict, List, Pattern
 
 from playwright.sync_api import Page
 
 from .base_page import BasePage
-from ..locators import LaunchpadLocators
-from ..core import WaitTimes
+from ..components import VoiceModal
+from ..locators import COMMON_LOCATORS, LaunchpadLocators
+from ..core import Timeouts, WaitTimes
 
 
 class LaunchpadPage(BasePage):
@@ -32,11 +35,19 @@ class LaunchpadPage(BasePage):
         "The Big Yellow Sun",
     ]
 
+    # Collects every book cover's data-qa id and title in one round-trip
+    BOOK_COVER_HARVEST_SCRIPT = (
+        "(selector) => [...document.querySelectorAll(selector)].map("
+        "e => ({id: e.getAttribute('data-qa'), title: e.innerText.trim()}))"
+    )
+
     def __init__(
         self,
         page: Page,
         debug_enabled: bool = False,
         lesson_name: str | None = None,
+        voice_modal_timeout: int = Timeouts.LONG_TIMEOUT,
+        ui_language: str = "auto",
     ):
         """
         Initialize the Launchpad Page.
@@ -46,6 +57,10 @@ class LaunchpadPage(BasePage):
             debug_enabled: Whether to enable debug screenshots
             lesson_name: Regex pattern for the target lesson name.
                          If None, reads from LESSON_NAME env var or uses default.
+            voice_modal_timeout: How long to wait for the voice modal on
+                         lesson entry, in milliseconds
+            ui_language: Interface language ("en", "es") to match labels as
+                         plain text, or "auto" to match either via regex
         """
         super().__init__(page, debug_enabled)
         self._locators = LaunchpadLocators()
@@ -53,6 +68,57 @@ class LaunchpadPage(BasePage):
         self._lesson_name = lesson_name or os.getenv(
             "LESSON_NAME", self.DEFAULT_LESSON_NAME
         )
+        self._voice_modal = VoiceModal(page, debug_enabled)
+        self._voice_modal_timeout = voice_modal_timeout
+        self._ui_language = ui_language
+
+        # Navigation targets never change for this page; build them once
+        self._book_covers = page.locator(self._locators.BOOK_COVER_PREFIX)
+        self._foundations = page.get_by_text(
+            self._label(
+                self._locators.FOUNDATIONS_TEXT_EN,
+                self._locators.FOUNDATIONS_TEXT_ES,
+                self._locators.FOUNDATIONS_PATTERN,
+            )
+        )
+        self._browse_content = page.get_by_text(
+            self._locators.BROWSE_CONTENT_PATTERN
+        )
+        self._second_lesson_link = page.locator("a").nth(1)
+        self._see_all_stories = page.locator(self._locators.STORIES_SECTION).locator(
+            self._locators.SEE_ALL_LINK
+        )
+        self._first_list_item = page.get_by_role("listitem").first
+        self._listen_mode = page.get_by_text(
+            self._label(
+                COMMON_LOCATORS.LISTEN_TEXT_EN,
+                COMMON_LOCATORS.LISTEN_TEXT_ES,
+                COMMON_LOCATORS.LISTEN_PATTERN,
+            )
+        )
+
+        # Fixed opening clicks of navigate_to_lesson, in order:
+        # (log message, target, screenshot name)
+        self._nav_steps = (
+            ("Entering 'Foundations/Fundamentos'...", self._foundations, "foundations"),
+            ("Exploring all content...", self._browse_content, "browse_all_content"),
+            (
+                "Selecting 'View All Stories'...",
+                self._see_all_stories,
+                "view_all_stories",
+            ),
+        )
+
+        # Configured lesson first, then the fallbacks, compiled once
+        self._lesson_patterns = tuple(
+            (name, re.compile(name, re.IGNORECASE))
+            for name in [self._lesson_name, *self.FALLBACK_LESSONS]
+        )
+        # All of them as one alternation, for a single in-browser match
+        self._any_lesson_pattern = re.compile(
+            "|".join(f"(?:{name})" for name, _ in self._lesson_patterns),
+            re.IGNORECASE,
+        )
 
     # ==================== Navigation Actions ====================
 
@@ -65,8 +131,7 @@ class LaunchpadPage(BasePage):
         """
         self._log("Entering 'Foundations/Fundamentos'...")
 
-        foundations_element = self._page.get_by_text(self._locators.FOUNDATIONS_PATTERN)
-        self.click_safe(foundations_element)
+        self.click_safe(self._foundations)
         self.take_screenshot("foundations")
 
         return self
@@ -80,8 +145,7 @@ class LaunchpadPage(BasePage):
         """
         self._log("Exploring all content...")
 
-        browse_element = self._page.get_by_text(self._locators.BROWSE_CONTENT_PATTERN)
-        self.click_safe(browse_element)
+        self.click_safe(self._browse_content)
         self.take_screenshot("browse_all_content")
 
         return self
@@ -95,8 +159,7 @@ class LaunchpadPage(BasePage):
         """
         self._log("Selecting second lesson...")
 
-        lesson_link = self._page.locator("a").nth(1)
-        self.click_safe(lesson_link)
+        self.click_safe(self._second_lesson_link)
         self.take_screenshot("selected_second_lesson")
 
         return self
@@ -110,9 +173,7 @@ class LaunchpadPage(BasePage):
         """
         self._log("Selecting 'View All Stories'...")
 
-        stories_section = self._page.locator(self._locators.STORIES_SECTION)
-        see_all_link = stories_section.locator(self._locators.SEE_ALL_LINK)
-        self.click_safe(see_all_link)
+        self.click_safe(self._see_all_stories)
         self.take_screenshot("view_all_stories")
 
         return self
@@ -127,40 +188,82 @@ class LaunchpadPage(BasePage):
         Returns:
             Self for method chaining
         """
-        import re
-
-        # Lista de lecciones a intentar: primero la configurada, luego los fallbacks
-        lessons_to_try = [self._lesson_name] + self.FALLBACK_LESSONS
-
-        for lesson_name in lessons_to_try:
-            self._log(f"Searching for lesson: {lesson_name}")
+        # Leer todas las portadas de una vez y buscar los nombres en Python
+        self.wait_for_element(self._book_covers.first)
+        covers = self._harvest_book_covers()
 
-            pattern = re.compile(lesson_name, re.IGNORECASE)
+        for lesson_name, pattern in self._lesson_patterns:
+            self._log("Searching for lesson: %s", lesson_name)
 
-            book_cover = self._page.locator(
-                self._locators.BOOK_COVER_PREFIX,
-                has_text=pattern,
-            )
-
-            # Verificar si el elemento existe y es visible
-            try:
-                if book_cover.count() > 0 and book_cover.first.is_visible(timeout=2000):
-                    self._log(f"Found lesson: {lesson_name}")
-                    self.click_safe(book_cover.first)
-                    self.take_screenshot("entered_specific_lesson")
-                    return self
-            except Exception:
-                self._log(f"Lesson '{lesson_name}' not found, trying next...")
+            cover = next((c for c in covers if pattern.search(c["title"])), None)
+            if cover is None:
+                self._log("Lesson '%s' not found, trying next...", lesson_name)
                 continue
 
+            cover_id = cover["id"]
+            book_cover = self._page.locator(f'[data-qa="{cover_id}"]').first
+            self._log("Found lesson: %s", lesson_name)
+            if self.click_safe(book_cover):
+                self.take_screenshot("entered_specific_lesson")
+                return self
+
+        # Sin títulos leídos: una sola consulta con todos los nombres a la vez
+        if not covers:
+            any_lesson = self._book_covers.filter(
+                has_text=self._any_lesson_pattern
+            ).first
+            if self.click_safe(any_lesson, timeout=Timeouts.SHORT_TIMEOUT):
+                self._log("Found a configured or fallback lesson.")
+                self.take_screenshot("entered_specific_lesson")
+                return self
+
         # Si ninguna lección fue encontrada, intentar con la primera disponible
         self._log("No specific lesson found, selecting first available story...")
-        first_book = self._page.locator(self._locators.BOOK_COVER_PREFIX).first
-        self.click_safe(first_book)
+        self.click_safe(self._book_covers.first)
         self.take_screenshot("entered_specific_lesson")
 
         return self
 
+    def _harvest_book_covers(self) -> List[Dict[str, str]]:
+        """
+        Read every book cover's data-qa id and title in a single evaluate.
+
+        Returns:
+            List of {"id", "title"} dicts, empty if none could be read
+        """
+        try:
+            covers = self._page.evaluate(
+                self.BOOK_COVER_HARVEST_SCRIPT, self._locators.BOOK_COVER_PREFIX
+            )
+        except Exception as e:
+            self._log("Could not read book covers: %s", e, level="DEBUG")
+            return []
+        return [c for c in covers if c.get("id")]
+
+    def _label(
+        self, text_en: str, text_es: str, pattern: Pattern[str]
+    ) -> str | Pattern[str]:
+        """
+        Pick the text to match for a UI label.
+
+        With a known interface language the literal label is returned, so
+        Playwright does a plain substring match instead of running a RegExp
+        over every text node; "auto" keeps the bilingual pattern.
+
+        Args:
+            text_en: Label in the English interface
+            text_es: Label in the Spanish interface
+            pattern: Pattern matching either language
+
+        Returns:
+            Literal label or the pattern, for get_by_text()
+        """
+        if self._ui_language == "en":
+            return text_en
+        if self._ui_language == "es":
+            return text_es
+        return pattern
+
     def enter_first_item(self) -> "LaunchpadPage":
         """
         Enter the first item in the launchpad (used for establishing session).
@@ -174,13 +277,17 @@ class LaunchpadPage(BasePage):
             with self._page.expect_navigation(
                 wait_until="domcontentloaded", timeout=30000
             ):
-                self._page.get_by_role("listitem").first.click()
+                self._first_list_item.click()
 
-            self.medium_wait()
-            self._log(f"Navigation complete. URL: {self.url}")
+            # Ready once the document finishes loading, not after a fixed pause
+            self._page.wait_for_function(
+                "document.readyState === 'complete'",
+                timeout=Timeouts.LONG_TIMEOUT,
+            )
+            self._log("Navigation complete. URL: %s", self.url)
 
         except Exception as e:
-            self._log(f"Navigation from launchpad: {e}", level="DEBUG")
+            self._log("Navigation from launchpad: %s", e, level="DEBUG")
 
         return self
 
@@ -193,22 +300,21 @@ class LaunchpadPage(BasePage):
         Returns:
             True if on launchpad, False otherwise
         """
-        return "launchpad" in self.url.lower() or "login.rosettastone.com" in self.url
+        url = self.url.lower()
+        return "launchpad" in url or "login.rosettastone.com" in url
 
     # ==================== Full Navigation Flows ====================
 
     def navigate_to_lesson(self) -> None:
         """Execute the complete navigation flow to a specific lesson."""
-        from ..components import VoiceModal
-
-        self.enter_foundations()
-        self.browse_all_content()
-        self.view_all_stories()
+        for message, target, screenshot in self._nav_steps:
+            self._log(message)
+            self.click_safe(target)
+            self.take_screenshot(screenshot)
         self.select_specific_lesson()
 
         # Handle voice modal
-        voice_modal = VoiceModal(self._page, self._debug_enabled)
-        voice_modal.wait_and_dismiss()
+        self._voice_modal.wait_and_dismiss(timeout=self._voice_modal_timeout)
         self.take_screenshot("continue_without_voice")
 
         # Select listen mode
@@ -219,11 +325,7 @@ class LaunchpadPage(BasePage):
 
     def _select_listen_mode(self) -> None:
         """Select the Listen/Escuchar mode."""
-        from ..locators import CommonLocators
-
         self._log("Selecting 'Listen/Escuchar' mode...")
 
-        common = CommonLocators()
-        listen_element = self._page.get_by_text(common.LISTEN_PATTERN)
-        self.click_safe(listen_element)
+        self.click_safe(self._listen_mode)
         self.take_screenshot("listen_mode")
@@ -1,11 +1,14 @@
 """Lesson Page Object for managing lesson activity automation."""
 
-from playwright.sync_api import Page
+from typing import Optional
+
+from playwright.sync_api import Locator, Page
 
 from .base_page import BasePage
-from ..locators import LessonLocators, CommonLocators
+from ..locators import COMMON_LOCATORS, LessonLocators
 from ..components import VoiceModal
-from ..core import WaitTimes
+from ..services import AudioPlayerService
+from ..core import Timeouts, WaitTimes
 
 
 class LessonPage(BasePage):
@@ -19,6 +22,26 @@ class LessonPage(BasePage):
     - Infinite loop functionality
     """
 
+    # Player and mode controls are in-page JS toggles that never navigate, so
+    # skip Playwright's post-click wait and fail fast if they are missing.
+    _TOGGLE_CLICK = {"no_wait_after": True, "timeout": Timeouts.SHORT_TIMEOUT}
+
+    # Installs (once per document) a MutationObserver that keeps
+    # window.__lessonDone in sync with whether any completion text is shown,
+    # re-testing at most every 500 ms. Returns the current flag.
+    COMPLETION_WATCH_SCRIPT = (
+        "(source) => { if (window.__lessonDone === undefined) {"
+        " const re = new RegExp(source, 'i'); let queued = false;"
+        " const check = () => { queued = false;"
+        " window.__lessonDone = re.test(document.body.innerText); };"
+        " new MutationObserver(() => { if (!queued) {"
+        " queued = true; setTimeout(check, 500); } })"
+        ".observe(document.body,"
+        " {childList: true, subtree: true, characterData: true});"
+        " check(); }"
+        " return window.__lessonDone; }"
+    )
+
     def __init__(self, page: Page, debug_enabled: bool = False):
         """
         Initialize the Lesson Page.
@@ -29,8 +52,51 @@ class LessonPage(BasePage):
         """
         super().__init__(page, debug_enabled)
         self._locators = LessonLocators()
-        self._common_locators = CommonLocators()
-        self._voice_modal = VoiceModal(page, debug_enabled)
+        self._common_locators = COMMON_LOCATORS
+
+        # URL of the lesson player, recorded once audio has played so a
+        # restart can navigate straight back to it
+        self._lesson_url: Optional[str] = None
+
+        self._bind_page(page)
+        self._completion_source = "|".join(
+            pattern.pattern
+            for pattern in (
+                self._locators.COMPLETION_PATTERN,
+                self._locators.NEXT_LESSON_PATTERN,
+                self._locators.CONTINUE_PATTERN,
+            )
+        )
+
+    def _bind_page(self, page: Page) -> None:
+        """
+        Build the components and locators tied to a Playwright page.
+
+        Args:
+            page: Playwright Page object the lesson runs in
+        """
+        self._voice_modal = VoiceModal(page, self._debug_enabled)
+        self._audio_player = AudioPlayerService(page)
+
+        # Control locators are lazy, so they can be built once and reused
+        # across every activity cycle instead of being rebuilt per click.
+        self._play_control = page.locator(self._locators.PLAY_CONTROL).nth(
+            self._locators.PLAY_CONTROL_INDEX
+        )
+        self._pause_control = page.locator(self._locators.PAUSE_CONTROL).nth(
+            self._locators.PAUSE_CONTROL_INDEX
+        )
+        self._rewind_control = page.get_by_text(self._locators.REWIND_TEXT)
+        self._listen_button = page.get_by_text(self._common_locators.LISTEN_PATTERN)
+        self._read_button = page.get_by_text(self._common_locators.READ_PATTERN)
+
+        # Any visible completion indicator, resolved in one query
+        self._completion_indicator = (
+            page.get_by_text(self._locators.COMPLETION_PATTERN)
+            .or_(page.get_by_text(self._locators.NEXT_LESSON_PATTERN))
+            .or_(page.get_by_role("button", name=self._locators.CONTINUE_PATTERN))
+            .filter(visible=True)
+        )
 
     # ==================== Audio Controls ====================
 
@@ -42,10 +108,9 @@ class LessonPage(BasePage):
             True if successful, False otherwise
         """
         try:
-            play_btn = self._page.locator(self._locators.PLAY_CONTROL).nth(
-                self._locators.PLAY_CONTROL_INDEX
-            )
-            play_btn.click()
+            self._play_control.click(**self._TOGGLE_CLICK)
+            if self._lesson_url is None:
+                self._lesson_url = self.url
             return True
         except Exception:
             self._log("Play control not found.", level="WARN")
@@ -60,11 +125,9 @@ class LessonPage(BasePage):
         """
         self._log("Pausing audio...", level="LOOP")
         try:
-            pause_btn = self._page.locator(self._locators.PAUSE_CONTROL).nth(
-                self._locators.PAUSE_CONTROL_INDEX
-            )
-            pause_btn.click()
-            self.wait(5)
+            self._pause_control.click(**self._TOGGLE_CLICK)
+            # Paused once the play control is back
+            self.wait_for_element(self._play_control, timeout=Timeouts.SHORT_TIMEOUT)
             return True
         except Exception:
             return False
@@ -77,12 +140,10 @@ class LessonPage(BasePage):
             True if successful, False otherwise
         """
         self._log("Rewinding 10 seconds...", level="LOOP")
-        try:
-            self._page.get_by_text(self._locators.REWIND_TEXT).click()
-            self.wait(5)
-            return True
-        except Exception:
+        if not self._click_control(self._rewind_control):
             return False
+        self.settle()
+        return True
 
     # ==================== Mode Controls ====================
 
@@ -93,16 +154,11 @@ class LessonPage(BasePage):
         Returns:
             True if successful, False otherwise
         """
-        try:
-            listen_btn = self._page.get_by_text(self._common_locators.LISTEN_PATTERN)
-            if listen_btn.count() > 0:
-                listen_btn.first.click()
-                self._log("Listen mode selected.", level="DEBUG")
-                self.wait(1)
-                return True
-        except Exception:
-            pass
-        return False
+        if not self._click_control(self._listen_button):
+            return False
+        self._log("Listen mode selected.", level="DEBUG")
+        self.settle(Timeouts.SHORT_TIMEOUT)
+        return True
 
     def set_read_mode(self) -> bool:
         """
@@ -111,27 +167,40 @@ class LessonPage(BasePage):
         Returns:
             True if successful, False otherwise
         """
+        if not self._click_control(self._read_button):
+            return False
+        self._log("Read mode selected.", level="DEBUG")
+        self.settle(Timeouts.SHORT_TIMEOUT)
+        return True
+
+    def _click_control(self, text_locator: Locator) -> bool:
+        """
+        Click a text-labelled control.
+
+        The click itself is the presence check: a missing control fails the
+        click's own timeout instead of costing a separate count() query.
+
+        Args:
+            text_locator: Text-based locator for the control
+
+        Returns:
+            True if the control was clicked, False if it is not on the page
+        """
         try:
-            read_btn = self._page.get_by_text(self._common_locators.READ_PATTERN)
-            if read_btn.count() > 0:
-                read_btn.first.click()
-                self._log("Read mode selected.", level="DEBUG")
-                self.wait(1)
-                return True
+            text_locator.first.click(**self._TOGGLE_CLICK)
+            return True
         except Exception:
-            pass
-        return False
+            return False
 
     def toggle_modes(self) -> None:
         """Toggle between read and listen modes."""
         self._log("Secondary actions: Read and Listen...", level="LOOP")
+        # Each mode switch already settles the page after its click
         try:
             self.set_read_mode()
-            self.wait(5)
             self.set_listen_mode()
         except Exception:
             pass
-        self.wait(5)
 
     # ==================== Lesson State ====================
 
@@ -139,20 +208,21 @@ class LessonPage(BasePage):
         """
         Check if the lesson has been completed.
 
+        The in-page observer flag rules the lesson out without querying the
+        DOM; only when completion text is on screen is the indicator locator
+        consulted to confirm it.
+
         Returns:
             True if lesson is completed, False otherwise
         """
         try:
-            completion_indicators = [
-                self._page.get_by_text(self._locators.COMPLETION_PATTERN),
-                self._page.get_by_text(self._locators.NEXT_LESSON_PATTERN),
-                self._page.get_by_role("button", name=self._locators.CONTINUE_PATTERN),
-            ]
-
-            for indicator in completion_indicators:
-                if indicator.count() > 0 and indicator.first.is_visible():
-                    self._log("Lesson completion indicator found.", level="DEBUG")
-                    return True
+            if not self._page.evaluate(
+                self.COMPLETION_WATCH_SCRIPT, self._completion_source
+            ):
+                return False
+            if self._completion_indicator.count() > 0:
+                self._log("Lesson completion indicator found.", level="DEBUG")
+                return True
 
             return False
         except Exception:
@@ -172,26 +242,34 @@ class LessonPage(BasePage):
             restart_btn = self._page.get_by_role(
                 "button", name=self._locators.RESTART_PATTERN
             )
-            if restart_btn.count() > 0:
-                restart_btn.first.click()
+            try:
+                restart_btn.first.click(timeout=Timeouts.SHORT_TIMEOUT)
                 self._log("Restart button clicked.", level="DEBUG")
-                self.wait(3)
+                self.settle()
                 return True
+            except Exception:
+                pass
 
-            # Fallback: reload page
-            current_url = self.url
-            self._log(f"Reloading URL: {current_url}", level="DEBUG")
-            self.reload()
-            self.wait(3)
-
-            # Handle modals after reload
-            self._voice_modal.dismiss_if_present()
+            # Fallback: go back to the lesson URL. Only the navigation commit
+            # is awaited; the modal and mode clicks below wait for their own
+            # elements instead of a full network idle.
+            if self._lesson_url is not None:
+                self._log("Reloading URL: %s", self._lesson_url, level="DEBUG")
+                self._page.goto(self._lesson_url, wait_until="commit")
+                self._voice_modal.dismiss_if_present(wait_for_visible=True)
+                self.wait_for_element(
+                    self._listen_button.first, timeout=Timeouts.LONG_TIMEOUT
+                )
+            else:
+                self._log("Reloading URL: %s", self.url, level="DEBUG")
+                self.reload()
+                self._voice_modal.dismiss_if_present()
             self.set_listen_mode()
 
             return True
 
         except Exception as e:
-            self._log(f"Error restarting lesson: {e}", level="ERROR")
+            self._log("Error restarting lesson: %s", e, level="ERROR")
             return False
 
     # ==================== Activity Cycle ====================
@@ -206,13 +284,13 @@ class LessonPage(BasePage):
 
     def _wait_and_debug(self, seconds: float, iteration: int = 0) -> None:
         """
-        Wait and optionally take debug screenshot.
+        Wait for the audio to end and optionally take debug screenshot.
 
         Args:
-            seconds: Seconds to wait
+            seconds: Maximum seconds to wait
             iteration: Current iteration number for naming screenshots
         """
-        self.wait(seconds)
+        self._audio_player.wait_for_playback_end(seconds)
 
         if self._debug_enabled and iteration <= 3:
             try:
@@ -238,38 +316,42 @@ class LessonPage(BasePage):
         try:
             while True:
                 lesson_iteration += 1
-                self._log(f"=== Lesson iteration #{lesson_iteration} ===")
-
-                # Run lesson cycle
-                self._run_single_lesson_cycle()
+                self._log("=== Lesson iteration #%d ===", lesson_iteration)
 
-                # Check completion and restart if needed
-                if self.is_lesson_completed():
+                # Run lesson cycle; it reports completion, restart if needed
+                if self._run_single_lesson_cycle():
                     self._log("Lesson completed, restarting...")
                     self.restart_lesson()
                 else:
                     self._log("Continuing with lesson...")
 
-                self._log(f"Iteration #{lesson_iteration} completed.")
+                self._log("Iteration #%d completed.", lesson_iteration)
                 self.wait(2)
 
         except KeyboardInterrupt:
             self._log("Infinite lesson loop interrupted by user.")
 
-    def _run_single_lesson_cycle(self) -> None:
-        """Execute a single lesson cycle with multiple activity cycles."""
+    def _run_single_lesson_cycle(self) -> bool:
+        """
+        Execute a single lesson cycle with multiple activity cycles.
+
+        Returns:
+            True if the lesson was completed, False otherwise
+        """
         max_cycles = 10
 
         for cycle in range(max_cycles):
-            self._log(f"Cycle {cycle + 1}: Playing audio...", level="LOOP")
+            self._log("Cycle %d: Playing audio...", cycle + 1, level="LOOP")
 
             self.run_activity_cycle()
 
             if self.is_lesson_completed():
-                break
+                return True
 
             self._log("Cycle completed.", level="LOOP")
 
+        return False
+
     def run_standard_activity_loop(self) -> None:
         """
         Run standard activity loop (non-infinite).
@@ -286,7 +368,7 @@ class LessonPage(BasePage):
         try:
             while True:
                 iteration += 1
-                self._log(f"Iteration {iteration}: Playing audio...", level="LOOP")
+                self._log("Iteration %d: Playing audio...", iteration, level="LOOP")
 
                 self.run_activity_cycle()
 
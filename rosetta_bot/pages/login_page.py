@@ -1,9 +1,8 @@
 """Login Page Object following Page Object Model pattern."""
 
-import time
-from typing import Optional
+from typing import Dict, Optional
 
-from playwright.sync_api import Page, Locator
+from playwright.sync_api import Frame, Page, Locator
 
 from .base_page import BasePage
 from ..locators import LoginLocators
@@ -28,6 +27,28 @@ class LoginPage(BasePage):
     - Login verification
     """
 
+    # Fills the first visible email and password inputs of one form and
+    # submits it, in a single evaluate. Values go through the native setter
+    # plus input/change events so framework-controlled inputs pick them up,
+    # and requestSubmit() runs the form's own submit handlers. Returns false
+    # (touching nothing) unless both fields sit in the same main-frame form.
+    SUBMIT_IN_PAGE_SCRIPT = (
+        "([emailSel, passwordSel, email, password]) => {"
+        " const visible = sel => [...document.querySelectorAll(sel)]"
+        ".find(el => el.getClientRects().length > 0);"
+        " const emailEl = visible(emailSel), passwordEl = visible(passwordSel);"
+        " if (!emailEl || !passwordEl || !emailEl.form"
+        " || emailEl.form !== passwordEl.form) return false;"
+        " const setValue = Object.getOwnPropertyDescriptor("
+        "HTMLInputElement.prototype, 'value').set;"
+        " for (const [el, value] of [[emailEl, email], [passwordEl, password]]) {"
+        " setValue.call(el, value);"
+        " el.dispatchEvent(new Event('input', {bubbles: true}));"
+        " el.dispatchEvent(new Event('change', {bubbles: true})); }"
+        " emailEl.form.requestSubmit();"
+        " return true; }"
+    )
+
     def __init__(self, page: Page, debug_enabled: bool = False):
         """
         Initialize the Login Page.
@@ -40,34 +61,100 @@ class LoginPage(BasePage):
         self._locators = LoginLocators()
         self._cookie_consent = CookieConsent(page, debug_enabled)
 
+        # Form fields found by find_in_frames, keyed by selector. Scoped to a
+        # single login() call and cleared on every frame navigation or form
+        # submit because the cached locators may go stale.
+        self._field_cache: Dict[str, Locator] = {}
+        page.on("framenavigated", self._on_frame_navigated)
+
+        # URL of the frame whose sign-in button last worked; tried first on
+        # the next retry instead of probing every login frame again.
+        self._working_login_frame: Optional[str] = None
+
+        # Main-frame locators are lazy and survive navigations, so unlike the
+        # frame-scan results above they are built once and never invalidated.
+        self._submit_button = page.locator(self._locators.SUBMIT_BUTTON).first
+        self._main_email_field = page.locator(self._locators.EMAIL_SELECTORS).first
+        self._main_password_field = page.locator(
+            self._locators.PASSWORD_SELECTORS
+        ).first
+        self._institutional_account = page.locator(
+            self._locators.INSTITUTIONAL_ACCOUNT
+        ).first
+        self._institutional_indicator = page.get_by_text(
+            self._locators.INSTITUTIONAL_PATTERN
+        ).first
+        self._institutional_name = page.get_by_text(
+            self._locators.INSTITUTIONAL_ACCOUNT_NAME, exact=False
+        ).first
+
     # ==================== Properties ====================
 
     @property
     def email_field(self) -> Optional[Locator]:
         """Get the email input field locator."""
-        locator = self.find_in_frames(self._locators.EMAIL_SELECTORS)
-        if not locator:
-            locator = self.find_in_frames(self._locators.EMAIL_FALLBACK_SELECTORS)
-        return locator
+        return self._find_field(self._locators.EMAIL_ANY_SELECTORS)
 
     @property
     def password_field(self) -> Optional[Locator]:
         """Get the password input field locator."""
-        return self.find_in_frames(self._locators.PASSWORD_SELECTORS)
+        return self._find_field(self._locators.PASSWORD_SELECTORS)
 
     @property
     def submit_button(self) -> Locator:
         """Get the submit button locator."""
-        return self._page.locator(self._locators.SUBMIT_BUTTON).first
+        return self._submit_button
+
+    # ==================== Field Cache ====================
+
+    def _find_field(self, selector: str) -> Optional[Locator]:
+        """
+        Find a form field across frames, reusing a previous hit.
+
+        A cached locator is only reused while it still resolves to an element;
+        otherwise the frames are scanned again.
+
+        Args:
+            selector: CSS selector for the field
+
+        Returns:
+            Locator if found, None otherwise
+        """
+        locator = self._field_cache.get(selector)
+        if locator is not None:
+            try:
+                if locator.count() > 0:
+                    return locator
+            except Exception:
+                pass
+            del self._field_cache[selector]
+
+        locator = self.find_in_frames(selector)
+        if locator is not None:
+            self._field_cache[selector] = locator
+        return locator
+
+    def _on_frame_navigated(self, frame: Frame) -> None:
+        """Drop cached field locators after any frame navigation."""
+        self._clear_field_cache()
+
+    def _clear_field_cache(self) -> None:
+        """Drop cached field locators, e.g. after the form was submitted."""
+        self._field_cache.clear()
 
     # ==================== Actions ====================
 
     def open(self) -> "LoginPage":
         """Navigate to the login page."""
         self._log("Opening login page...")
-        self.navigate_to(self._locators.LOGIN_URL)
-        self.wait_for_load()
-        self._cookie_consent.dismiss_if_present()
+        self.navigate_to(self._locators.LOGIN_URL, wait_until="domcontentloaded")
+        # A restored storage_state session has already left the login page
+        # (and accepted cookies), so there is no form or banner to wait for.
+        if is_login_url(self.url):
+            self.wait_for_element(
+                self._main_email_field, timeout=Timeouts.LONG_TIMEOUT
+            )
+            self._cookie_consent.dismiss_if_present()
         self.take_screenshot("login_page")
         return self
 
@@ -82,6 +169,7 @@ class LoginPage(BasePage):
         Returns:
             True if login was successful, False otherwise
         """
+        self._clear_field_cache()
         self.open()
 
         # A restored storage_state session redirects straight into the app.
@@ -90,6 +178,9 @@ class LoginPage(BasePage):
             self.take_screenshot("already_logged_in")
             return True
 
+        if self._submit_in_page(email, password):
+            return self._verify_login_success(password)
+
         if not self._fill_email(email):
             return False
 
@@ -100,6 +191,51 @@ class LoginPage(BasePage):
 
         return self._verify_login_success(password)
 
+    def _submit_in_page(self, email: str, password: str) -> bool:
+        """
+        Fill and submit a main-frame login form with one page script.
+
+        Returns False, without touching the form, for iframe-hosted or split
+        email/password forms; the caller then runs the regular fill and
+        submit steps. Once the script has submitted, True is returned however
+        the submit turns out, so the credentials are never sent twice:
+        _verify_login_success judges the outcome.
+
+        Args:
+            email: User email address
+            password: User password
+
+        Returns:
+            True if the form was submitted, False if it was left untouched
+        """
+        start_url = self.url
+        try:
+            submitted = self._page.evaluate(
+                self.SUBMIT_IN_PAGE_SCRIPT,
+                [
+                    self._locators.EMAIL_ANY_SELECTORS,
+                    self._locators.PASSWORD_SELECTORS,
+                    email,
+                    password,
+                ],
+            )
+        except Exception:
+            # The submit's own navigation can tear down the script's context
+            # before it returns; it submitted if the page is leaving the form.
+            submitted = None
+        if submitted is False:
+            return False
+
+        navigated = self._wait_for_navigation_from(
+            start_url, timeout=Timeouts.DEFAULT_TIMEOUT
+        )
+        if submitted is None and not navigated:
+            return False
+
+        self._log("Login form filled and submitted in page.")
+        self._clear_field_cache()
+        return True
+
     def _fill_email(self, email: str) -> bool:
         """
         Fill the email field.
@@ -114,7 +250,7 @@ class LoginPage(BasePage):
 
         email_locator = self.email_field
         if not email_locator:
-            self._log(f"Email field not found. Current URL: {self.url}", level="ERROR")
+            self._log("Email field not found. Current URL: %s", self.url, level="ERROR")
             self.take_screenshot("no_email")
             return False
 
@@ -135,7 +271,7 @@ class LoginPage(BasePage):
         password_locator = self.password_field
         if not password_locator:
             self._log(
-                f"Password field not found. Current URL: {self.url}", level="ERROR"
+                "Password field not found. Current URL: %s", self.url, level="ERROR"
             )
             self.take_screenshot("no_password")
             return False
@@ -143,35 +279,78 @@ class LoginPage(BasePage):
         return self.fill_safe(password_locator, password)
 
     def _submit_form(self) -> None:
-        """Submit the login form using multiple strategies."""
+        """
+        Submit the login form, escalating only when needed.
+
+        Presses Enter on the password field first and only falls back to
+        clicking the submit button (with retries) if that did not navigate.
+        """
         self._log("Submitting form...")
+        start_url = self.url
 
         # Try pressing Enter on password field
+        pressed = False
         try:
             password_locator = self.password_field
             if password_locator:
                 password_locator.press("Enter")
+                pressed = True
         except Exception:
             pass
 
-        # Try clicking submit button (wait for it to be enabled)
-        try:
-            submit_btn = self.submit_button
-            if self.wait_for_element(submit_btn, timeout=Timeouts.LONG_TIMEOUT):
-                self.click_safe(
-                    submit_btn,
-                    scroll=False,
-                    wait_enabled=True,
-                    timeout=Timeouts.LONG_TIMEOUT,
-                )
-        except Exception:
-            pass
+        # Whatever the submit leads to, the old field locators are done
+        self._clear_field_cache()
+
+        if pressed and self._wait_for_navigation_from(
+            start_url, timeout=Timeouts.DEFAULT_TIMEOUT
+        ):
+            return
+
+        # Enter did not navigate: click the submit button instead
+        self.retry_action(self._click_submit_button, max_retries=2)
+        self._clear_field_cache()
+
+        # Wait for the submit to navigate (into the app or on to the Microsoft
+        # sign-in) rather than for a network idle that the app's persistent
+        # connections may never reach.
+        if not self._wait_for_navigation_from(start_url, timeout=Timeouts.LONG_TIMEOUT):
+            try:
+                self.wait_for_load(timeout=Timeouts.SHORT_TIMEOUT)
+            except Exception:
+                pass
+
+    def _click_submit_button(self) -> bool:
+        """Click the submit button once it is visible and enabled."""
+        submit_btn = self.submit_button
+        if not self.wait_for_element(submit_btn, timeout=Timeouts.LONG_TIMEOUT):
+            return False
+        return self.click_safe(
+            submit_btn,
+            scroll=False,
+            wait_enabled=True,
+            timeout=Timeouts.LONG_TIMEOUT,
+        )
+
+    def _wait_for_navigation_from(self, start_url: str, timeout: int) -> bool:
+        """
+        Wait until the page leaves start_url.
+
+        Args:
+            start_url: URL the page was on before the action
+            timeout: Timeout in milliseconds
 
-        # Wait for navigation
+        Returns:
+            True if the URL changed in time, False otherwise
+        """
         try:
-            self.wait_for_load(timeout=Timeouts.LONG_TIMEOUT)
+            self._page.wait_for_url(
+                lambda url: url != start_url,
+                wait_until="domcontentloaded",
+                timeout=timeout,
+            )
+            return True
         except Exception:
-            pass
+            return False
 
     def _verify_login_success(self, password: str) -> bool:
         """
@@ -191,6 +370,12 @@ class LoginPage(BasePage):
         """
         self._log("Verifying login success...")
 
+        # Happy path: the submit already left every login page, so skip the
+        # institutional/KMSI probes entirely.
+        if not is_login_url(self.url):
+            self.take_screenshot("logged_in")
+            return True
+
         # Handle institutional account selection if needed (best-effort; the
         # URL check below is the real verdict).
         self._handle_institutional_account(password)
@@ -211,25 +396,31 @@ class LoginPage(BasePage):
 
         blocker = self._detect_login_blocker()
         if blocker:
-            self._log(f"Login blocked: {blocker}", level="ERROR")
+            self._log("Login blocked: %s", blocker, level="ERROR")
         self._log(
-            f"Login did not complete - still on {self.url}. {MANUAL_LOGIN_HINT}",
+            "Login did not complete - still on %s. %s",
+            self.url,
+            MANUAL_LOGIN_HINT,
             level="ERROR",
         )
         self.take_screenshot("login_failed")
         return False
 
     def _wait_until_authenticated(self, timeout_sec: int) -> bool:
-        """Poll until the URL leaves every login/authentication page."""
-        deadline = time.time() + timeout_sec
-        while time.time() < deadline:
-            try:
-                if not is_login_url(self.url):
-                    return True
-            except Exception:
-                pass
-            self.wait(1)
-        return False
+        """Wait until the URL leaves every login/authentication page.
+
+        Driven by the page's navigation events, so it returns on the
+        navigation itself instead of on the next one-second poll.
+        """
+        try:
+            self._page.wait_for_url(
+                lambda url: not is_login_url(url),
+                wait_until="domcontentloaded",
+                timeout=timeout_sec * 1000,
+            )
+            return True
+        except Exception:
+            return False
 
     def _detect_login_blocker(self) -> Optional[str]:
         """Identify the verification/MFA/error screen blocking the login."""
@@ -248,27 +439,19 @@ class LoginPage(BasePage):
 
         self._log("Accepting 'Stay signed in?' prompt...")
         try:
-            checkbox = self._page.locator("#KmsiCheckboxField").first
+            checkbox = self._page.locator(self._locators.KMSI_CHECKBOX).first
             if self.is_visible(checkbox, timeout=1500):
                 checkbox.check()
         except Exception:
             pass
 
-        for selector in (
-            "#idSIButton9",
-            "input[type='submit'][value='Yes']",
-            "input[type='submit'][value='Sí']",
-            "button:has-text('Yes')",
-            "button:has-text('Sí')",
-        ):
-            try:
-                btn = self._page.locator(selector).first
-                if self.is_visible(btn, timeout=1500):
-                    btn.click()
-                    self.wait(2)
-                    return
-            except Exception:
-                continue
+        try:
+            btn = self._page.locator(self._locators.KMSI_ACCEPT_BUTTON).first
+            if self.is_visible(btn, timeout=1500):
+                btn.click()
+                self.wait(2)
+        except Exception:
+            pass
 
     def _handle_institutional_account(self, password: str) -> bool:
         """
@@ -281,52 +464,46 @@ class LoginPage(BasePage):
             True if institutional account was handled, False otherwise
         """
         try:
-            self.wait_for_load(timeout=Timeouts.DEFAULT_TIMEOUT)
-
-            # Look for institutional selectors
-            for selector in self._locators.INSTITUTIONAL_SELECTORS:
-                try:
-                    element = self._page.locator(selector).first
-                    if self.is_visible(element, timeout=Timeouts.SHORT_TIMEOUT):
-                        self._log("Found institutional account selector...")
-                        self.click_safe(element)
-
-                        # Re-enter password after account selection
-                        self._log("Re-entering password for institutional account...")
-                        self.wait_for_load()
-                        self._fill_password(password)
-                        self._submit_form()
-                        self.wait_for_load()
-
-                        self.take_screenshot("institutional_login_complete")
-                        return True
-                except Exception:
-                    continue
-
-            # Check page content for institutional indicators
-            page_content = self._page.content().lower()
-            if any(
-                ind in page_content for ind in ["uleam", "universidad", "institution"]
-            ):
+            self.wait_for_load("domcontentloaded", timeout=Timeouts.DEFAULT_TIMEOUT)
+
+            # Look for the institutional account picker
+            account = self._institutional_account
+            if self.wait_for_element(account, timeout=Timeouts.VERY_SHORT_TIMEOUT):
+                self._log("Found institutional account selector...")
+            else:
+                # Check visible text for institutional indicators
+                if not self.is_visible(self._institutional_indicator):
+                    return False
                 self._log("Detected institutional page, looking for account...")
-                try:
-                    uleam_element = self._page.get_by_text("uleam", exact=False).first
-                    self.click_safe(uleam_element)
+                account = self._institutional_name
+
+            if not self.click_safe(account):
+                return False
+            self._clear_field_cache()
 
-                    self.wait_for_load()
-                    self._fill_password(password)
-                    self._submit_form()
-                    self.wait_for_load()
+            # Re-enter password after account selection
+            self._log("Re-entering password for institutional account...")
+            self._wait_for_password_field()
+            self._fill_password(password)
+            self._submit_form()
 
-                    return True
-                except Exception:
-                    pass
+            self.take_screenshot("institutional_login_complete")
+            return True
 
         except Exception as e:
-            self._log(f"Error during institutional account handling: {e}", level="WARN")
+            self._log(
+                "Error during institutional account handling: %s", e, level="WARN"
+            )
 
         return False
 
+    def _wait_for_password_field(self) -> None:
+        """Wait for the password field instead of a full network idle."""
+        self.wait_for_load("domcontentloaded")
+        self.wait_for_element(
+            self._main_password_field, timeout=Timeouts.LONG_TIMEOUT
+        )
+
     def _retry_login_click(self) -> None:
         """Retry clicking login button with multiple strategies."""
         try:
@@ -339,20 +516,27 @@ class LoginPage(BasePage):
 
     def _try_frame_login_buttons(self) -> None:
         """Try clicking login buttons in frames."""
-        for frame in self._page.frames:
+        # Only login frames can hold the sign-in button; probing each one
+        # briefly keeps the worst case bounded instead of N x 5s.
+        login_frames = [f for f in self._page.frames if is_login_url(f.url)]
+        if self._working_login_frame is not None:
+            login_frames.sort(key=lambda f: f.url != self._working_login_frame)
+        for frame in login_frames:
+            frame_url = frame.url
             try:
                 btn = frame.get_by_role("button").filter(
                     has_text=self._locators.SIGNIN_PATTERN
                 )
-                btn.first.click(timeout=Timeouts.DEFAULT_TIMEOUT)
+                btn.first.click(timeout=Timeouts.FRAME_PROBE_TIMEOUT)
+                self._working_login_frame = frame_url
                 return
             except Exception:
                 continue
 
         # Last resort: try submit button
         try:
-            self._page.locator(
-                "button[type='submit'], input[type='submit']"
-            ).first.click(timeout=Timeouts.DEFAULT_TIMEOUT)
+            self._page.locator(self._locators.SUBMIT_FALLBACK).first.click(
+                timeout=Timeouts.DEFAULT_TIMEOUT
+            )
         except Exception:
             pass
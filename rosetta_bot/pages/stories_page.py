@@ -6,8 +6,9 @@ from playwright.sync_api import Page, Locator
 
 from .base_page import BasePage
 from .launchpad_page import LaunchpadPage
-from ..locators import StoriesLocators, CommonLocators
+from ..locators import COMMON_LOCATORS, StoriesLocators
 from ..components import AudioModal, VoiceModal
+from ..services import AudioPlayerService, StoryNavigatorService
 from ..core import WaitTimes, Timeouts
 
 
@@ -32,9 +33,28 @@ class StoriesPage(BasePage):
         """
         super().__init__(page, debug_enabled)
         self._locators = StoriesLocators()
-        self._common_locators = CommonLocators()
+        self._common_locators = COMMON_LOCATORS
         self._audio_modal = AudioModal(page, debug_enabled)
         self._voice_modal = VoiceModal(page, debug_enabled)
+        self._audio_player = AudioPlayerService(page)
+        self._navigator = StoryNavigatorService(page)
+        self._story_links = page.locator(self._locators.STORY_LINKS)
+
+        # Player and mode controls used every cycle. Locators are live
+        # queries, so these stay valid across story navigations.
+        self._play_button = page.locator(self._locators.PLAY_BUTTON).nth(
+            self._locators.PLAY_BUTTON_INDEX
+        )
+        self._circle_button = page.locator(self._locators.CIRCLE_BUTTON)
+        self._listen_button = page.get_by_text(
+            self._common_locators.LISTEN_PATTERN
+        ).first
+        self._read_button = page.get_by_text(self._common_locators.READ_PATTERN).first
+
+        # Completion text or a "next story" label, resolved in one query
+        self._completion_indicator = page.get_by_text(
+            self._locators.COMPLETION_PATTERN
+        ).or_(page.get_by_text(self._locators.NEXT_STORY_PATTERN))
 
     # ==================== Navigation ====================
 
@@ -52,10 +72,10 @@ class StoriesPage(BasePage):
             timeout=Timeouts.VERY_LONG_TIMEOUT,
         )
         self.wait_for_load(timeout=30000)
-        self.medium_wait()
+        self._wait_for_story_links()
 
-        self._log(f"Current URL: {self.url}")
-        self._log(f"Page title: {self.title}")
+        self._log("Current URL: %s", self.url)
+        self._log("Page title: %s", self.title)
 
         return self
 
@@ -89,24 +109,27 @@ class StoriesPage(BasePage):
         self._log("Navigation to Stories successful.")
         return self._verify_stories_loaded()
 
+    def _wait_for_story_links(self, timeout: int = Timeouts.LONG_TIMEOUT) -> bool:
+        """Wait until the first story tile is rendered, up to timeout ms."""
+        return self.wait_for_element(self._story_links.first, timeout=timeout)
+
     def _is_on_launchpad(self) -> bool:
         """Check if currently on launchpad."""
-        return "launchpad" in self.url or "login.rosettastone.com" in self.url
+        url = self.url
+        return "launchpad" in url or "login.rosettastone.com" in url
 
     def _verify_stories_loaded(self) -> bool:
-        """Verify that stories are loaded on the page."""
-        stories = self._page.locator(self._locators.STORY_LINKS)
-        count = stories.count()
-
-        if count > 0:
-            self._log(f"Found {count} stories available.")
-            return True
+        """
+        Verify that stories are loaded on the page.
 
-        # Wait and retry
-        self._log("Waiting for stories to load...")
-        self.short_wait()
-        count = stories.count()
-        self._log(f"After waiting: {count} stories found.")
+        One bounded wait, which returns at once if a story link is already
+        rendered. Never fails navigation: tiles may render without links,
+        and get_available_stories has its own fallbacks.
+        """
+        if self._wait_for_story_links(Timeouts.DEFAULT_TIMEOUT):
+            self._log("Found %d stories available.", self._story_links.count())
+        else:
+            self._log("No story links rendered yet, continuing.", level="DEBUG")
 
         return True
 
@@ -120,27 +143,22 @@ class StoriesPage(BasePage):
             List of tuples (story_name, locator)
         """
         self.wait_for_load()
-        self.medium_wait()
+        self._wait_for_story_links()
 
         # Handle audio modal
         self._audio_modal.dismiss_if_present()
 
-        stories_found = []
-
-        self._log(f"Searching for {len(self._locators.KNOWN_STORIES)} known stories...")
+        stories_found = self._navigator.harvest_tiles()
+        if stories_found:
+            self._log("Found %d stories to process.", len(stories_found))
+            return stories_found
 
-        for story_name in self._locators.KNOWN_STORIES:
-            try:
-                element = self._page.get_by_text(story_name, exact=True)
-                if element.count() > 0:
-                    self._log(f"✓ Found: {story_name}", level="DEBUG")
-                    stories_found.append((story_name, element.first))
-                else:
-                    self._log(f"✗ Not visible: {story_name}", level="DEBUG")
-            except Exception as e:
-                self._log(f"Error searching for '{story_name}': {e}", level="DEBUG")
+        self._log(
+            "Searching for %d known stories...", len(self._locators.KNOWN_STORIES)
+        )
 
-        self._log(f"Found {len(stories_found)} stories to process.")
+        stories_found = self._navigator.find_known_stories()
+        self._log("Found %d stories to process.", len(stories_found))
 
         if not stories_found:
             self._debug_no_stories_found()
@@ -150,12 +168,17 @@ class StoriesPage(BasePage):
     def _debug_no_stories_found(self) -> None:
         """Debug helper when no stories are found."""
         self._log("No stories found.", level="WARN")
-        self._page.screenshot(path="debug/no_stories_found.png")
-        self._log("Screenshot saved to debug/no_stories_found.png", level="DEBUG")
+
+        # Saved even with debugging off: the only artifact of this failure
+        try:
+            self._page.screenshot(path="debug/no_stories_found.png")
+            self._log("Screenshot saved to debug/no_stories_found.png", level="DEBUG")
+        except Exception as e:
+            self._log("Could not save screenshot: %s", e, level="DEBUG")
 
         try:
             page_text = self._page.inner_text("body")
-            self._log(f"First 500 chars: {page_text[:500]}", level="DEBUG")
+            self._log("First 500 chars: %s", page_text[:500], level="DEBUG")
         except Exception:
             pass
 
@@ -173,13 +196,13 @@ class StoriesPage(BasePage):
             True if processed successfully, False otherwise
         """
         try:
-            self._log(f"Processing story: {story_name}")
+            self._log("Processing story: %s", story_name)
 
             # Click on story
             story_element.scroll_into_view_if_needed()
             self.very_short_wait()
             story_element.click()
-            self._log(f"Clicked on '{story_name}' successfully.", level="DEBUG")
+            self._log("Clicked on '%s' successfully.", story_name, level="DEBUG")
             self.short_wait()
 
             # Execute listen/read cycle
@@ -191,7 +214,7 @@ class StoriesPage(BasePage):
             return True
 
         except Exception as e:
-            self._log(f"Error processing story '{story_name}': {e}", level="ERROR")
+            self._log("Error processing story '%s': %s", story_name, e, level="ERROR")
             self._return_to_stories_list()
             return False
 
@@ -202,7 +225,7 @@ class StoriesPage(BasePage):
         Args:
             story_title: Title of the story for logging
         """
-        self._log(f"Starting listen/read cycle for '{story_title}'...")
+        self._log("Starting listen/read cycle for '%s'...", story_title)
 
         # Handle modals
         self._audio_modal.dismiss_if_present()
@@ -215,20 +238,20 @@ class StoriesPage(BasePage):
         max_cycles = 5
 
         for cycle in range(max_cycles):
-            self._log(f"Cycle {cycle + 1} in story '{story_title}'", level="DEBUG")
+            self._log("Cycle %d in story '%s'", cycle + 1, story_title, level="DEBUG")
 
             # Play audio
             self._play_audio()
 
-            # Wait for audio
-            self.wait(WaitTimes.ACTIVITY_CYCLE)
+            # Wait for the audio to end (bounded by ACTIVITY_CYCLE)
+            self._audio_player.wait_for_playback_end(WaitTimes.ACTIVITY_CYCLE)
 
             # Alternate modes
             self._alternate_read_listen()
 
             # Check if story completed
             if self._is_story_completed():
-                self._log(f"Story '{story_title}' completed.")
+                self._log("Story '%s' completed.", story_title)
                 break
 
             self.very_short_wait()
@@ -236,8 +259,7 @@ class StoriesPage(BasePage):
     def _set_listen_mode(self) -> None:
         """Set the initial listen mode."""
         try:
-            listen_btn = self._page.get_by_text(self._common_locators.LISTEN_PATTERN)
-            listen_btn.first.click(timeout=Timeouts.SHORT_TIMEOUT)
+            self._listen_button.click(timeout=Timeouts.SHORT_TIMEOUT)
             self._log("Listen mode activated.", level="DEBUG")
             self.very_short_wait()
         except Exception:
@@ -248,15 +270,11 @@ class StoriesPage(BasePage):
     def _play_audio(self) -> None:
         """Play the story audio."""
         try:
-            play_btn = self._page.locator(self._locators.PLAY_BUTTON).nth(
-                self._locators.PLAY_BUTTON_INDEX
-            )
-            play_btn.click(timeout=Timeouts.SHORT_TIMEOUT)
+            self._play_button.click(timeout=Timeouts.SHORT_TIMEOUT)
             self._log("Audio started (polygon).", level="DEBUG")
         except Exception:
             try:
-                circle_btn = self._page.locator(self._locators.CIRCLE_BUTTON)
-                circle_btn.click(timeout=Timeouts.SHORT_TIMEOUT)
+                self._circle_button.click(timeout=Timeouts.SHORT_TIMEOUT)
                 self._log("Audio started (circle).", level="DEBUG")
             except Exception:
                 self._log("Could not start audio with known methods.", level="DEBUG")
@@ -265,46 +283,43 @@ class StoriesPage(BasePage):
         """Alternate between read and listen modes."""
         try:
             # Switch to read mode
-            read_btn = self._page.get_by_text(self._common_locators.READ_PATTERN)
-            read_btn.first.click(timeout=Timeouts.SHORT_TIMEOUT)
+            self._read_button.click(timeout=Timeouts.SHORT_TIMEOUT)
             self._log("Switched to read mode.", level="DEBUG")
             self.very_short_wait()
 
             # Switch back to listen mode
-            listen_btn = self._page.get_by_text(self._common_locators.LISTEN_PATTERN)
-            listen_btn.first.click(timeout=Timeouts.SHORT_TIMEOUT)
+            self._listen_button.click(timeout=Timeouts.SHORT_TIMEOUT)
             self._log("Switched to listen mode.", level="DEBUG")
             self.very_short_wait()
 
         except Exception as e:
-            self._log(f"Error alternating read/listen modes: {e}", level="DEBUG")
+            self._log("Error alternating read/listen modes: %s", e, level="DEBUG")
 
     def _is_story_completed(self) -> bool:
         """Check if the current story is completed."""
         try:
-            # Check completion indicator
-            completion = self._page.get_by_text(self._locators.COMPLETION_PATTERN)
-            if completion.count() > 0:
-                return True
-
-            # Check next story button
-            next_story = self._page.get_by_text(self._locators.NEXT_STORY_PATTERN)
-            if next_story.count() > 0:
-                return True
-
-            return False
+            return self._completion_indicator.count() > 0
         except Exception:
             return False
 
     def _return_to_stories_list(self) -> bool:
-        """Return to the stories list."""
+        """
+        Return to the stories list.
+
+        From a story the list is one history step back, so going back avoids
+        a fresh load; navigating to the list URL is the fallback.
+        """
+        if self._navigator.go_back_to_list():
+            self._log("Returned to stories list.", level="DEBUG")
+            return True
+
         try:
-            self.navigate_to(self._locators.STORIES_URL, wait_until="networkidle")
+            self.navigate_to(self._locators.STORIES_URL, wait_until="domcontentloaded")
             self._log("Returned to stories list.", level="DEBUG")
             self.short_wait()
             return True
         except Exception as e:
-            self._log(f"Failed to return to stories list: {e}", level="ERROR")
+            self._log("Failed to return to stories list: %s", e, level="ERROR")
             return False
 
     # ==================== Infinite Loop ====================
@@ -327,17 +342,17 @@ class StoriesPage(BasePage):
         try:
             while True:
                 iteration += 1
-                self._log(f"=== Complete iteration #{iteration} ===")
+                self._log("=== Complete iteration #%d ===", iteration)
 
                 self._process_all_stories_once()
 
-                self._log(f"Iteration #{iteration} completed. Restarting cycle...")
+                self._log("Iteration #%d completed. Restarting cycle...", iteration)
                 self.short_wait()
 
         except KeyboardInterrupt:
             self._log("Infinite loop interrupted by user.")
         except Exception as e:
-            self._log(f"Error in infinite loop: {e}", level="ERROR")
+            self._log("Error in infinite loop: %s", e, level="ERROR")
 
     def _process_all_stories_once(self) -> None:
         """Process all available stories once."""
@@ -351,7 +366,7 @@ class StoriesPage(BasePage):
             return
 
         for i, (story_name, story_element) in enumerate(stories):
-            self._log(f"=== Story {i + 1}/{total}: {story_name} ===")
+            self._log("=== Story %d/%d: %s ===", i + 1, total, story_name)
 
             self.process_story(story_name, story_element)
 
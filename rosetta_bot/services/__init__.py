@@ -4,6 +4,7 @@ from .audio_player import AudioPlayerService
 from .mode_switcher import ModeSwitcherService
 from .debug_service import DebugService
 from .frame_finder import FrameFinderService
+from .story_navigator import StoryNavigatorService
 from .time_tracker import TimeTracker, get_user_status, list_all_users
 
 __all__ = [
@@ -11,6 +12,7 @@ __all__ = [
     "ModeSwitcherService",
     "DebugService",
     "FrameFinderService",
+    "StoryNavigatorService",
     "TimeTracker",
     "get_user_status",
     "list_all_users",
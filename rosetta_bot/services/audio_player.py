@@ -1,8 +1,11 @@
 """Audio player service for controlling media playback."""
 
-from playwright.sync_api import Page
+import time
+from typing import Dict
 
-from ..core import Logger, Timeouts, WaitTimes, get_logger
+from playwright.sync_api import Locator, Page, TimeoutError as PlaywrightTimeoutError
+
+from ..core import Logger, WaitTimes, get_logger
 
 
 class AudioPlayerService:
@@ -22,6 +25,14 @@ class AudioPlayerService:
     PAUSE_BUTTON_INDEX = 1
     REWIND_TEXT = "10"
 
+    # Truthy once the lesson's <audio> element has ended or failed; stays
+    # falsy while playing or when the page exposes no <audio> element.
+    MEDIA_ENDED_SCRIPT = (
+        "() => { const a = document.querySelector('audio'); "
+        "return !!a && (a.ended || !!a.error); }"
+    )
+    MEDIA_POLL_INTERVAL_MS = 500
+
     def __init__(self, page: Page, logger: Logger = None):
         """
         Initialize the audio player service.
@@ -33,6 +44,15 @@ class AudioPlayerService:
         self._page = page
         self._logger = logger or get_logger("AudioPlayer")
 
+        # Control locators are lazy; build them once and reuse them per call
+        self._play_polygon = page.locator(self.PLAY_BUTTON).nth(self.PLAY_BUTTON_INDEX)
+        self._play_circle = page.locator(self.CIRCLE_BUTTON)
+        self._pause_button = page.locator(self.PAUSE_BUTTON).nth(
+            self.PAUSE_BUTTON_INDEX
+        )
+        # Rewind buttons keyed by their seconds label
+        self._rewind_buttons: Dict[int, Locator] = {}
+
     def play(self) -> bool:
         """
         Start audio playback.
@@ -55,14 +75,11 @@ class AudioPlayerService:
 
     def _try_click_polygon(self) -> bool:
         """Try to click the polygon play button."""
-        import time
-
         try:
             # Wait briefly for DOM to stabilize after mode switch
             time.sleep(0.5)
-            play_btn = self._page.locator(self.PLAY_BUTTON).nth(self.PLAY_BUTTON_INDEX)
             # Use force=True to bypass actionability checks
-            play_btn.click(timeout=Timeouts.DEFAULT, force=True)
+            self._play_polygon.click(force=True, no_wait_after=True)
             self._logger.debug("Audio started (polygon).")
             return True
         except Exception:
@@ -70,12 +87,9 @@ class AudioPlayerService:
 
     def _try_click_circle(self) -> bool:
         """Try to click the circle play button."""
-        import time
-
         try:
             time.sleep(0.3)
-            circle_btn = self._page.locator(self.CIRCLE_BUTTON)
-            circle_btn.click(timeout=Timeouts.DEFAULT, force=True)
+            self._play_circle.click(force=True, no_wait_after=True)
             self._logger.debug("Audio started (circle).")
             return True
         except Exception:
@@ -89,10 +103,7 @@ class AudioPlayerService:
             True if paused successfully, False otherwise
         """
         try:
-            pause_btn = self._page.locator(self.PAUSE_BUTTON).nth(
-                self.PAUSE_BUTTON_INDEX
-            )
-            pause_btn.click()
+            self._pause_button.click(no_wait_after=True)
             self._logger.debug("Audio paused.")
             return True
         except Exception:
@@ -110,9 +121,49 @@ class AudioPlayerService:
             True if rewound successfully, False otherwise
         """
         try:
-            self._page.get_by_text(str(seconds)).click()
+            rewind_btn = self._rewind_buttons.get(seconds)
+            if rewind_btn is None:
+                rewind_btn = self._page.get_by_text(str(seconds))
+                self._rewind_buttons[seconds] = rewind_btn
+            rewind_btn.click(no_wait_after=True)
             self._logger.debug(f"Audio rewound by {seconds} seconds.")
             return True
         except Exception:
             self._logger.warn(f"Could not rewind audio by {seconds}s.")
             return False
+
+    def wait_for_playback_end(self, max_seconds: float) -> None:
+        """
+        Wait until the audio ends, capped at max_seconds.
+
+        The <audio> element is polled inside the page (no round-trip per
+        tick), so the wait ends as soon as playback ends or fails. When no
+        <audio> element can be observed, waits the full max_seconds. Waiting
+        goes through Playwright so page events (dialogs, navigations) keep
+        being dispatched, and a closed page ends the wait immediately.
+
+        Args:
+            max_seconds: Upper bound for the wait in seconds
+        """
+        deadline = time.monotonic() + max_seconds
+        try:
+            self._page.wait_for_function(
+                self.MEDIA_ENDED_SCRIPT,
+                timeout=max_seconds * 1000,
+                polling=self.MEDIA_POLL_INTERVAL_MS,
+            )
+            self._logger.debug("Audio playback ended.")
+            return
+        except PlaywrightTimeoutError:
+            return
+        except Exception:
+            # Navigation destroyed the page context; wait out the rest.
+            pass
+
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            return
+        try:
+            self._page.wait_for_timeout(remaining * 1000)
+        except Exception:
+            return
@@ -1,13 +1,58 @@
 """Debug service for screenshots and diagnostics."""
 
+import atexit
 import re
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Optional
+from typing import Dict, List, Optional, Tuple
 
 from playwright.sync_api import Page
 
 from ..core import Logger, get_logger
 
+# (url, title, [(frame name, frame url)]) captured for a dump
+_PageInfo = Tuple[str, str, List[Tuple[str, str]]]
+
+# Characters not allowed in dump file names
+_UNSAFE_TAG_CHARS = re.compile(r"[^0-9A-Za-z_.-]")
+
+# Dump files are written off the main thread. Playwright itself is not
+# thread-safe, so only the disk writes move here; one worker for the whole
+# process keeps the dumps in order.
+_writer: Optional[ThreadPoolExecutor] = None
+
+
+def _get_writer() -> ThreadPoolExecutor:
+    """Return the shared dump writer, creating it on first use."""
+    global _writer
+    if _writer is None:
+        _writer = ThreadPoolExecutor(max_workers=1, thread_name_prefix="debug-dump")
+    return _writer
+
+
+# Last dump number per debug directory. Shared by every DebugService (each
+# page object has its own) so the numbering never restarts mid-run; written
+# to .dump_index only every _COUNTER_FLUSH_EVERY dumps and at exit.
+_counters: Dict[Path, int] = {}
+_COUNTER_FLUSH_EVERY = 32
+
+
+def _save_counter(debug_dir: Path) -> None:
+    """Persist the dump counter of a debug directory."""
+    try:
+        (debug_dir / ".dump_index").write_text(
+            str(_counters[debug_dir]), encoding="utf-8"
+        )
+    except Exception:
+        pass
+
+
+@atexit.register
+def _save_all_counters() -> None:
+    """Persist every dump counter on interpreter exit."""
+    for debug_dir in list(_counters):
+        _save_counter(debug_dir)
+
 
 class DebugService:
     """
@@ -19,6 +64,10 @@ class DebugService:
     """
 
     DEFAULT_DEBUG_DIR = "debug"
+    # JPEGs are far cheaper to encode and write than PNGs. Screenshots are
+    # viewport-only unless full_page is asked for explicitly: that is still
+    # enough to see where the bot got stuck.
+    SCREENSHOT_OPTIONS = {"type": "jpeg", "quality": 60}
 
     def __init__(
         self,
@@ -40,90 +89,134 @@ class DebugService:
         self._debug_dir = Path(debug_dir)
         self._enabled = enabled
         self._logger = logger or get_logger("Debug")
-        self._counter = 0
 
         # Ensure debug directory exists
         if self._enabled:
             self._debug_dir.mkdir(exist_ok=True)
-            self._load_counter()
+            if self._debug_dir not in _counters:
+                self._load_counter()
 
     def _load_counter(self) -> None:
         """Load the persistent counter from file."""
         idx_file = self._debug_dir / ".dump_index"
         try:
-            self._counter = int(idx_file.read_text(encoding="utf-8").strip() or "0")
-        except Exception:
-            self._counter = 0
-
-    def _save_counter(self) -> None:
-        """Save the counter to file."""
-        idx_file = self._debug_dir / ".dump_index"
-        try:
-            idx_file.write_text(str(self._counter), encoding="utf-8")
+            _counters[self._debug_dir] = int(
+                idx_file.read_text(encoding="utf-8").strip() or "0"
+            )
         except Exception:
-            pass
+            _counters[self._debug_dir] = 0
 
     def _sanitize_tag(self, tag: str) -> str:
         """Sanitize a tag for use in filenames."""
-        return re.sub(r"[^0-9A-Za-z_.-]", "_", tag).strip("_")
+        return _UNSAFE_TAG_CHARS.sub("_", tag).strip("_")
 
-    def dump(self, tag: str = "state") -> Optional[str]:
+    def dump(self, tag: str = "state", full_page: bool = False) -> Optional[str]:
         """
         Create a debug dump with screenshot and page info.
 
         Args:
             tag: Tag for the dump filename
+            full_page: Capture the whole scrollable page instead of just the
+                       viewport; much slower on long or media-heavy pages
+
+        The screenshot is captured immediately; the files are written by a
+        background thread.
 
         Returns:
-            Path to the screenshot if created, None otherwise
+            Path the screenshot is written to, None if nothing was captured
         """
         if not self._enabled or self._page is None:
             return None
 
         try:
-            self._counter += 1
-            self._save_counter()
+            counter = _counters[self._debug_dir] + 1
+            _counters[self._debug_dir] = counter
 
             safe_tag = self._sanitize_tag(tag)
-            base_name = (
-                f"{self._counter}.{safe_tag}" if safe_tag else str(self._counter)
-            )
+            base_name = f"{counter}.{safe_tag}" if safe_tag else str(counter)
 
-            # Take screenshot
-            screenshot_path = self._debug_dir / f"{base_name}.png"
-            self._page.screenshot(path=str(screenshot_path), full_page=True)
-
-            # Log page info
-            self._log_page_info(base_name)
+            # Capture on this thread; the files are written in the background
+            screenshot_path = self._debug_dir / f"{base_name}.jpg"
+            image = self._page.screenshot(
+                full_page=full_page, **self.SCREENSHOT_OPTIONS
+            )
+            info = self._collect_page_info()
 
-            self._logger.debug(f"Dump saved: {base_name}")
+            writer = _get_writer()
+            writer.submit(self._write_dump, base_name, screenshot_path, image, info)
+            if counter % _COUNTER_FLUSH_EVERY == 0:
+                writer.submit(_save_counter, self._debug_dir)
             return str(screenshot_path)
 
         except Exception as e:
             self._logger.warn(f"Debug dump failed: {e}")
             return None
 
-    def _log_page_info(self, base_name: str) -> None:
-        """Log page information for debugging."""
-        try:
-            info = [
-                f"URL: {self._page.url}",
-                f"Title: {self._page.title()}",
-                f"Frames: {len(self._page.frames)}",
-            ]
+    def dump_full(self, tag: str = "state") -> Optional[str]:
+        """
+        Create a debug dump with a full-page screenshot.
 
-            for i, frame in enumerate(self._page.frames):
+        For one-off investigations; loop callers should stick to dump().
+
+        Args:
+            tag: Tag for the dump filename
+
+        Returns:
+            Path the screenshot is written to, None if nothing was captured
+        """
+        return self.dump(tag, full_page=True)
+
+    def _collect_page_info(self) -> Optional[_PageInfo]:
+        """
+        Capture the raw page details for a dump.
+
+        Only the values are read here, on the Playwright thread; turning
+        them into text is left to the writer thread.
+
+        Returns:
+            (url, title, [(frame name, frame url)]), None if unavailable
+        """
+        try:
+            frames = []
+            for frame in self._page.frames:
                 try:
-                    info.append(f"  [{i}] name={frame.name} url={frame.url}")
+                    frames.append((frame.name, frame.url))
                 except Exception:
                     pass
-
-            # Save info file
-            info_path = self._debug_dir / f"{base_name}.txt"
-            info_path.write_text("\n".join(info), encoding="utf-8")
-
+            return self._page.url, self._page.title(), frames
         except Exception:
-            pass
+            return None
+
+    @staticmethod
+    def _format_page_info(info: Optional[_PageInfo]) -> str:
+        """Render captured page details as the dump's text file."""
+        if info is None:
+            return ""
+        url, title, frames = info
+        lines = [f"URL: {url}", f"Title: {title}", f"Frames: {len(frames)}"]
+        lines.extend(
+            f"  [{i}] name={name} url={frame_url}"
+            for i, (name, frame_url) in enumerate(frames)
+        )
+        return "\n".join(lines)
+
+    def _write_dump(
+        self,
+        base_name: str,
+        screenshot_path: Path,
+        image: bytes,
+        info: Optional[_PageInfo],
+    ) -> None:
+        """Write a captured dump to disk (runs on the writer thread)."""
+        try:
+            screenshot_path.write_bytes(image)
+            text = self._format_page_info(info)
+            if text:
+                info_path = self._debug_dir / f"{base_name}.txt"
+                info_path.write_text(text, encoding="utf-8")
+            self._logger.debug(f"Dump saved: {base_name}")
+        except Exception as e:
+            self._logger.warn(f"Debug dump write failed: {e}")
 
     def screenshot(self, name: str) -> Optional[str]:
         """
@@ -139,8 +232,10 @@ class DebugService:
             return None
 
         try:
-            path = self._debug_dir / f"{name}.png"
-            self._page.screenshot(path=str(path))
+            path = self._debug_dir / f"{name}.jpg"
+            self._page.screenshot(
+                path=str(path), full_page=False, **self.SCREENSHOT_OPTIONS
+            )
             return str(path)
         except Exception as e:
             self._logger.warn(f"Screenshot failed: {e}")
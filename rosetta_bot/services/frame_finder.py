@@ -1,6 +1,7 @@
 """Frame finder service for locating elements across iframes."""
 
-from typing import Optional, Tuple, Union
+from collections import OrderedDict
+from typing import List, Optional, Tuple, Union
 
 from playwright.sync_api import Page, Frame, Locator
 
@@ -16,6 +17,9 @@ class FrameFinderService:
     Responsibility: Frame traversal and element location ONLY
     """
 
+    # Selectors whose winning frame is remembered
+    MAX_CACHED_SELECTORS = 32
+
     def __init__(self, page: Page, logger: Logger = None):
         """
         Initialize the frame finder service.
@@ -27,12 +31,21 @@ class FrameFinderService:
         self._page = page
         self._logger = logger or get_logger("FrameFinder")
 
+        # selector -> page/frame it was last found in, least recent first.
+        # Cleared on every frame navigation since the hit may be stale.
+        self._hits: "OrderedDict[str, Union[Frame, Page]]" = OrderedDict()
+        page.on("framenavigated", self._on_frame_navigated)
+
     def find_in_any_frame(
         self, selector: str, timeout: int = Timeouts.SHORT
     ) -> Tuple[Optional[Union[Frame, Page]], Optional[Locator]]:
         """
         Find an element in the main page or any iframe.
 
+        Every context is first checked once without waiting, so an element
+        that is already rendered is found in a single pass. Only when that
+        pass misses does each context get waited on in turn.
+
         Args:
             selector: CSS selector to search for
             timeout: Timeout for visibility check
@@ -40,19 +53,82 @@ class FrameFinderService:
         Returns:
             Tuple of (frame_or_page, locator) or (None, None) if not found
         """
+        cached = self._cached_hit(selector)
+        if cached[1] is not None:
+            return cached
+
+        contexts = [self._page, *self._child_frames()]
+
+        # Quick pass: is_visible() checks the current DOM and returns at once
+        for context in contexts:
+            try:
+                locator = context.locator(selector).first
+                if locator.is_visible():
+                    return self._remember(selector, context, locator)
+            except Exception:
+                continue
+
         # Try main page first
         result = self._try_find_in_context(self._page, selector, timeout)
         if result[1] is not None:
-            return result
+            return self._remember(selector, *result)
 
-        # Try all frames
-        for frame in self._page.frames:
+        # Then the frames that still exist, re-listed after the wait
+        for frame in self._child_frames():
             result = self._try_find_in_context(frame, selector, timeout // 2)
             if result[1] is not None:
-                return result
+                return self._remember(selector, *result)
 
         return None, None
 
+    def _cached_hit(
+        self, selector: str
+    ) -> Tuple[Optional[Union[Frame, Page]], Optional[Locator]]:
+        """
+        Reuse the context a selector was last found in, if it still shows it.
+
+        Args:
+            selector: CSS selector
+
+        Returns:
+            Tuple of (frame_or_page, locator) or (None, None) on a miss
+        """
+        context = self._hits.get(selector)
+        if context is None:
+            return None, None
+        try:
+            locator = context.locator(selector).first
+            if locator.is_visible():
+                self._hits.move_to_end(selector)
+                return context, locator
+        except Exception:
+            pass
+        del self._hits[selector]
+        return None, None
+
+    def _remember(
+        self, selector: str, context: Union[Frame, Page], locator: Locator
+    ) -> Tuple[Union[Frame, Page], Locator]:
+        """Record where a selector was found and pass the result through."""
+        self._hits[selector] = context
+        self._hits.move_to_end(selector)
+        if len(self._hits) > self.MAX_CACHED_SELECTORS:
+            self._hits.popitem(last=False)
+        return context, locator
+
+    def _on_frame_navigated(self, frame: Frame) -> None:
+        """Forget every cached hit after any frame navigation."""
+        self._hits.clear()
+
+    def _child_frames(self) -> List[Frame]:
+        """Attached frames other than the main frame (page.frames lists it)."""
+        main_frame = self._page.main_frame
+        return [
+            frame
+            for frame in self._page.frames
+            if frame is not main_frame and not frame.is_detached()
+        ]
+
     def _try_find_in_context(
         self, context: Union[Page, Frame], selector: str, timeout: int
     ) -> Tuple[Optional[Union[Frame, Page]], Optional[Locator]]:
@@ -1,11 +1,12 @@
 """Mode switcher service for Listen/Read mode transitions."""
 
-import re
+import time
 from typing import Pattern
 
-from playwright.sync_api import Page
+from playwright.sync_api import Locator, Page, TimeoutError as PlaywrightTimeoutError
 
 from ..core import Logger, Timeouts, get_logger
+from ..locators import CommonLocators
 
 
 class ModeSwitcherService:
@@ -17,9 +18,9 @@ class ModeSwitcherService:
     Responsibility: Mode switching ONLY
     """
 
-    # Compiled patterns for mode buttons
-    LISTEN_PATTERN: Pattern[str] = re.compile(r"escuchar|listen", re.IGNORECASE)
-    READ_PATTERN: Pattern[str] = re.compile(r"leer|read", re.IGNORECASE)
+    # Compiled patterns for mode buttons (shared with the page objects)
+    LISTEN_PATTERN: Pattern[str] = CommonLocators.LISTEN_PATTERN
+    READ_PATTERN: Pattern[str] = CommonLocators.READ_PATTERN
 
     def __init__(self, page: Page, logger: Logger = None):
         """
@@ -32,6 +33,10 @@ class ModeSwitcherService:
         self._page = page
         self._logger = logger or get_logger("ModeSwitcher")
 
+        # Mode buttons, built once and re-resolved by Playwright per click
+        self._listen_button = page.get_by_text(self.LISTEN_PATTERN).first
+        self._read_button = page.get_by_text(self.READ_PATTERN).first
+
     def set_listen_mode(self) -> bool:
         """
         Switch to Listen mode.
@@ -39,7 +44,7 @@ class ModeSwitcherService:
         Returns:
             True if switch successful, False otherwise
         """
-        return self._set_mode(self.LISTEN_PATTERN, "Listen")
+        return self._set_mode(self._listen_button, "Listen")
 
     def set_read_mode(self) -> bool:
         """
@@ -48,30 +53,32 @@ class ModeSwitcherService:
         Returns:
             True if switch successful, False otherwise
         """
-        return self._set_mode(self.READ_PATTERN, "Read")
+        return self._set_mode(self._read_button, "Read")
 
-    def _set_mode(self, pattern: Pattern[str], mode_name: str) -> bool:
+    def _set_mode(self, button: Locator, mode_name: str) -> bool:
         """
         Set a specific mode.
 
+        A missing button fails the click's short timeout instead of being
+        probed with a separate count() first.
+
         Args:
-            pattern: Regex pattern for the mode button
+            button: Locator for the mode button
             mode_name: Name for logging
 
         Returns:
             True if successful, False otherwise
         """
-        import time
-
         try:
-            button = self._page.get_by_text(pattern)
-            if button.count() > 0:
-                # Wait briefly for any animations to settle
-                time.sleep(0.5)
-                # Use force=True to bypass actionability checks (overlay issues)
-                button.first.click(timeout=Timeouts.DEFAULT, force=True)
-                self._logger.debug(f"{mode_name} mode activated.")
-                return True
+            # Wait briefly for any animations to settle
+            time.sleep(0.5)
+            # Use force=True to bypass actionability checks (overlay issues)
+            button.click(
+                force=True, no_wait_after=True, timeout=Timeouts.SHORT_TIMEOUT
+            )
+            self._logger.debug(f"{mode_name} mode activated.")
+            return True
+        except PlaywrightTimeoutError:
             self._logger.debug(f"{mode_name} mode button not found.")
             return False
         except Exception as e:
@@ -85,8 +92,6 @@ class ModeSwitcherService:
         Args:
             wait_seconds: Seconds to wait between switches
         """
-        import time
-
         self._logger.debug("Alternating modes: Read -> Listen")
 
         if self.set_read_mode():
@@ -0,0 +1,87 @@
+"""Story navigator service for finding stories on the stories list."""
+
+from typing import List, Tuple
+
+from playwright.sync_api import Locator, Page
+
+from ..core import Logger, Timeouts, get_logger
+from ..locators import StoriesLocators
+
+
+class StoryNavigatorService:
+    """
+    Service for finding stories on the stories list and getting back to it.
+
+    Shared by StoriesPage and StoriesWorkflow so both discover stories and
+    navigate the same way.
+
+    Responsibility: Story discovery and list navigation ONLY
+    """
+
+    def __init__(self, page: Page, logger: Logger = None):
+        """
+        Initialize the story navigator service.
+
+        Args:
+            page: Playwright Page object
+            logger: Optional logger instance
+        """
+        self._page = page
+        self._logger = logger or get_logger("StoryNavigator")
+        self._locators = StoriesLocators()
+
+        # Story tile titles and known names, re-resolved on every read
+        self._titles = page.locator(self._locators.STORY_TITLE)
+        self._known = page.get_by_text(self._locators.KNOWN_STORIES_PATTERN)
+
+    def harvest_tiles(self) -> List[Tuple[str, Locator]]:
+        """
+        Collect every story tile title in a single round-trip.
+
+        Returns:
+            List of (story_name, locator) tuples, empty if no tiles rendered
+        """
+        try:
+            texts = self._titles.all_inner_texts()
+        except Exception as e:
+            self._logger.debug(f"Could not read story tiles: {e}")
+            return []
+        return self._locators.story_matches(texts, self._titles)
+
+    def find_known_stories(self) -> List[Tuple[str, Locator]]:
+        """
+        Find the known story names on the page in one text query.
+
+        Fallback for when no story tiles rendered.
+
+        Returns:
+            List of (story_name, locator) tuples
+        """
+        try:
+            texts = self._known.all_inner_texts()
+        except Exception as e:
+            self._logger.debug(f"Error searching for known stories: {e}")
+            return []
+        return self._locators.story_matches(texts, self._known)
+
+    def go_back_to_list(self, timeout: int = Timeouts.LONG) -> bool:
+        """
+        Go back one history step from a story page.
+
+        The list is almost always the previous entry, so this skips the
+        full reload a goto() would do.
+
+        Args:
+            timeout: Navigation timeout in milliseconds
+
+        Returns:
+            True if the page is back on the stories list
+        """
+        if "/stories/" not in self._page.url:
+            return False
+        try:
+            self._page.go_back(wait_until="domcontentloaded", timeout=timeout)
+        except Exception:
+            return False
+        url = self._page.url
+        return "/stories" in url and "/stories/" not in url
@@ -1,12 +1,12 @@
 """Base workflow class with common functionality."""
 
-import time
 from abc import ABC, abstractmethod
 from typing import Optional
 
 from playwright.sync_api import Page
 
-from ..core import Logger, WaitTimes, get_logger
+from ..core import Logger, Timeouts, WaitTimes, get_logger
+from ..exceptions import BrowserError
 from ..services import AudioPlayerService, ModeSwitcherService, DebugService
 
 
@@ -23,6 +23,16 @@ class BaseWorkflow(ABC):
     Subclasses must implement the specific workflow logic.
     """
 
+    # Playback position of the page's <audio> element in seconds, or null
+    # when there is none. Sampled before and after the playback wait of the
+    # same cycle: if it did not move, the play click achieved nothing
+    # (blocking modal, dead control).
+    PLAYBACK_POSITION_SCRIPT = """() => {
+        const audio = document.querySelector('audio');
+        return audio ? audio.currentTime : null;
+    }"""
+    STALE_CYCLES_BEFORE_RECOVERY = 2
+
     def __init__(self, page: Page, debug_enabled: bool = False, logger: Logger = None):
         """
         Initialize the base workflow.
@@ -32,18 +42,31 @@ class BaseWorkflow(ABC):
             debug_enabled: Whether debugging is enabled
             logger: Optional logger instance
         """
-        self._page = page
         self._debug_enabled = debug_enabled
         self._logger = logger or get_logger(self.__class__.__name__)
-
-        # Initialize services
-        self._audio = AudioPlayerService(page, self._logger)
-        self._mode = ModeSwitcherService(page, self._logger)
-        self._debug = DebugService(page, enabled=debug_enabled, logger=self._logger)
+        self._bind_page(page)
 
         # Workflow state
         self._iteration = 0
         self._running = False
+        self._stale_cycles = 0
+
+    def _bind_page(self, page: Page) -> None:
+        """
+        Build the services tied to a Playwright page.
+
+        Runs from __init__ and again when the workflow moves to a new page.
+        Subclasses with page-bound state of their own extend it.
+
+        Args:
+            page: Playwright Page object the workflow runs in
+        """
+        self._page = page
+        self._audio = AudioPlayerService(page, self._logger)
+        self._mode = ModeSwitcherService(page, self._logger)
+        self._debug = DebugService(
+            page, enabled=self._debug_enabled, logger=self._logger
+        )
 
     @abstractmethod
     def run_once(self) -> bool:
@@ -70,6 +93,10 @@ class BaseWorkflow(ABC):
         Run the workflow in an infinite loop.
 
         Continues until interrupted by user (Ctrl+C).
+
+        Raises:
+            BrowserError: If the page is closed underneath the workflow, so
+                the caller can relaunch the browser
         """
         self._logger.info(f"Starting infinite {self.__class__.__name__}...")
 
@@ -86,6 +113,9 @@ class BaseWorkflow(ABC):
 
                 success = self.run_once()
 
+                if self._page.is_closed():
+                    raise BrowserError("Browser page was closed during the workflow.")
+
                 if success:
                     self._logger.info(f"Iteration #{self._iteration} completed.")
                 else:
@@ -95,7 +125,11 @@ class BaseWorkflow(ABC):
 
         except KeyboardInterrupt:
             self._logger.info("Workflow interrupted by user.")
+        except BrowserError:
+            raise
         except Exception as e:
+            if self._page.is_closed():
+                raise BrowserError(f"Browser page was closed: {e}") from e
             self._logger.error(f"Workflow error: {e}")
         finally:
             self._running = False
@@ -107,31 +141,94 @@ class BaseWorkflow(ABC):
     # ==================== Helper Methods ====================
 
     def _wait(self, seconds: float) -> None:
-        """Wait for specified seconds."""
-        time.sleep(seconds)
+        """
+        Wait for specified seconds.
+
+        Uses the page's timer rather than time.sleep so Playwright keeps
+        dispatching page events (dialogs, navigations) while the bot idles.
+        """
+        self._page.wait_for_timeout(seconds * 1000)
+
+    def _settle(self, timeout: int = Timeouts.DEFAULT) -> None:
+        """Wait for the network to go idle, capped at timeout (ms)."""
+        try:
+            self._page.wait_for_load_state("networkidle", timeout=timeout)
+        except Exception:
+            pass
 
     def _run_activity_cycle(self) -> None:
         """
         Run a single activity cycle.
 
-        Plays audio, waits, rewinds, pauses, and toggles modes.
+        Plays audio, waits, rewinds, pauses, and toggles modes. If playback
+        has not progressed for several cycles, recovers instead.
         """
+        if self._stale_cycles >= self.STALE_CYCLES_BEFORE_RECOVERY:
+            self._logger.warn(
+                f"No playback for {self._stale_cycles} cycles, recovering..."
+            )
+            self._stale_cycles = 0
+            self._recover()
+            return
+
         self._logger.loop("Playing audio...")
-        self._audio.play()
+        played = self._audio.play()
+        start = self._playback_position()
+
+        self._audio.wait_for_playback_end(WaitTimes.ACTIVITY_CYCLE)
 
-        self._wait(WaitTimes.ACTIVITY_CYCLE)
+        if self._playback_stalled(played, start, self._playback_position()):
+            self._stale_cycles += 1
+        else:
+            self._stale_cycles = 0
 
         self._logger.loop("Rewinding...")
         self._audio.rewind()
-        self._wait(5)
+        self._settle()
 
         self._logger.loop("Pausing...")
         self._audio.pause()
-        self._wait(5)
+        self._settle()
 
         self._logger.loop("Toggling modes...")
         self._mode.alternate_modes(wait_seconds=5)
-        self._wait(5)
+        self._settle()
+
+    def _playback_position(self) -> Optional[float]:
+        """Current <audio> position in seconds, None if it cannot be read."""
+        try:
+            return self._page.evaluate(self.PLAYBACK_POSITION_SCRIPT)
+        except Exception:
+            return None
+
+    @staticmethod
+    def _playback_stalled(
+        played: bool, start: Optional[float], end: Optional[float]
+    ) -> bool:
+        """
+        Decide whether this cycle's play attempt did nothing.
+
+        Args:
+            played: Whether the play click went through
+            start: Position sampled right after the play click
+            end: Position sampled after the playback wait
+
+        Returns:
+            True if the play click failed or the position did not advance;
+            False when there is no <audio> element to judge by
+        """
+        if not played:
+            return True
+        if start is None or end is None:
+            return False
+        return end <= start
+
+    def _recover(self) -> None:
+        """Recover from a stuck page. Subclasses may override."""
+        try:
+            self._page.reload(wait_until="domcontentloaded")
+        except Exception as e:
+            self._logger.warn(f"Recovery reload failed: {e}")
 
     def _take_debug_screenshot(self, tag: str) -> None:
         """Take a debug screenshot if enabled."""
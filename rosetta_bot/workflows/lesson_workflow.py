@@ -1,5 +1,7 @@
 """Lesson workflow for repeating a specific lesson."""
 
+from typing import Callable, Optional, Tuple
+
 from playwright.sync_api import Page
 
 from .base_workflow import BaseWorkflow
@@ -16,9 +18,21 @@ class LessonWorkflow(BaseWorkflow):
     - Run activity cycles (play, rewind, pause, toggle)
     - Detect lesson completion
     - Restart lesson when completed
+    - Move the lesson to a fresh page every MAX_ITERATIONS_BEFORE_RECYCLE
+      iterations, when the page's owner allows it
     """
 
-    def __init__(self, page: Page, debug_enabled: bool = False, logger: Logger = None):
+    # A long-running tab keeps growing (detached nodes, decoded audio), so
+    # the lesson is moved to a fresh one this often
+    MAX_ITERATIONS_BEFORE_RECYCLE = 100
+
+    def __init__(
+        self,
+        page: Page,
+        debug_enabled: bool = False,
+        logger: Logger = None,
+        recycle_page: Optional[Callable[[str], Optional[Page]]] = None,
+    ):
         """
         Initialize the lesson workflow.
 
@@ -26,14 +40,27 @@ class LessonWorkflow(BaseWorkflow):
             page: Playwright Page object
             debug_enabled: Whether debugging is enabled
             logger: Optional logger instance
+            recycle_page: Optional callback from the page's owner that opens
+                a fresh page on the given URL, closes the current one and
+                returns the new page (None to keep the current one)
         """
+        # Needed by _bind_page, which the base initializer calls
+        self._locators = LessonLocators()
+        self._recycle_page = recycle_page
         super().__init__(page, debug_enabled, logger or get_logger("LessonWorkflow"))
 
-        # Locators
-        self._locators = LessonLocators()
+    def _bind_page(self, page: Page) -> None:
+        """Build the services, locators and components tied to the page."""
+        super()._bind_page(page)
+        self._completion_indicator = (
+            page.get_by_text(self._locators.COMPLETION_PATTERN)
+            .or_(page.get_by_text(self._locators.NEXT_LESSON_PATTERN))
+            .or_(page.get_by_role("button", name=self._locators.CONTINUE_PATTERN))
+            .filter(visible=True)
+        )
 
         # Components
-        self._voice_modal = VoiceModal(page, debug_enabled)
+        self._voice_modal = VoiceModal(page, self._debug_enabled)
 
     def setup(self) -> bool:
         """
@@ -58,17 +85,34 @@ class LessonWorkflow(BaseWorkflow):
         Returns:
             True if cycle completed successfully
         """
-        # Run activity cycles
-        cycles_completed = self._run_lesson_cycles()
+        # Run activity cycles; they stop early once the lesson is completed
+        cycles_completed, lesson_completed = self._run_lesson_cycles()
 
-        # Check and handle completion
-        if self._is_lesson_completed():
+        if lesson_completed:
             self._logger.info("Lesson completed, restarting...")
             self._restart_lesson()
 
+        if self._iteration % self.MAX_ITERATIONS_BEFORE_RECYCLE == 0:
+            self._recycle()
+
         return cycles_completed > 0
 
-    def _run_lesson_cycles(self, max_cycles: int = 10) -> int:
+    def _recycle(self) -> None:
+        """Continue the lesson in a fresh page from the page's owner."""
+        if self._recycle_page is None:
+            return
+
+        page = self._recycle_page(self._page.url)
+        if page is None:
+            return
+
+        self._logger.debug("Lesson moved to a fresh page.")
+        self._bind_page(page)
+        page.on("dialog", lambda dialog: dialog.dismiss())
+        self._voice_modal.dismiss_if_present(wait_for_visible=True)
+        self._mode.set_listen_mode()
+
+    def _run_lesson_cycles(self, max_cycles: int = 10) -> Tuple[int, bool]:
         """
         Run multiple activity cycles.
 
@@ -76,7 +120,7 @@ class LessonWorkflow(BaseWorkflow):
             max_cycles: Maximum cycles before checking completion
 
         Returns:
-            Number of cycles completed
+            Number of cycles completed and whether the lesson was completed
         """
         for cycle in range(max_cycles):
             self._logger.loop(f"Cycle {cycle + 1}/{max_cycles}")
@@ -84,11 +128,11 @@ class LessonWorkflow(BaseWorkflow):
             self._run_activity_cycle()
 
             if self._is_lesson_completed():
-                return cycle + 1
+                return cycle + 1, True
 
             self._logger.loop("Cycle completed.")
 
-        return max_cycles
+        return max_cycles, False
 
     def _is_lesson_completed(self) -> bool:
         """
@@ -98,21 +142,19 @@ class LessonWorkflow(BaseWorkflow):
             True if completion indicators found
         """
         try:
-            indicators = [
-                self._page.get_by_text(self._locators.COMPLETION_PATTERN),
-                self._page.get_by_text(self._locators.NEXT_LESSON_PATTERN),
-                self._page.get_by_role("button", name=self._locators.CONTINUE_PATTERN),
-            ]
-
-            for indicator in indicators:
-                if indicator.count() > 0 and indicator.first.is_visible():
-                    self._logger.debug("Lesson completion detected.")
-                    return True
+            # One query for all indicators, counting visible matches only
+            if self._completion_indicator.count() > 0:
+                self._logger.debug("Lesson completion detected.")
+                return True
 
             return False
         except Exception:
             return False
 
+    def _recover(self) -> None:
+        """Recover from a stuck lesson by restarting it."""
+        self._restart_lesson()
+
     def _restart_lesson(self) -> bool:
         """
         Restart the current lesson.
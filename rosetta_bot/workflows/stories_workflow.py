@@ -7,7 +7,8 @@ from playwright.sync_api import Page, Locator
 from .base_workflow import BaseWorkflow
 from ..core import Logger, WaitTimes, Timeouts, URLs, get_logger
 from ..components import AudioModal, VoiceModal
-from ..locators import StoriesLocators, CommonLocators
+from ..locators import COMMON_LOCATORS, StoriesLocators
+from ..services import StoryNavigatorService
 
 
 class StoriesWorkflow(BaseWorkflow):
@@ -21,6 +22,10 @@ class StoriesWorkflow(BaseWorkflow):
     - Loop through all stories repeatedly
     """
 
+    # Stop probing for the "Continue without voice" modal after this many
+    # consecutive stories without it; it is shown once per session at most.
+    VOICE_MODAL_MISS_LIMIT = 3
+
     def __init__(self, page: Page, debug_enabled: bool = False, logger: Logger = None):
         """
         Initialize the stories workflow.
@@ -34,11 +39,18 @@ class StoriesWorkflow(BaseWorkflow):
 
         # Locators
         self._locators = StoriesLocators()
-        self._common_locators = CommonLocators()
+        self._common_locators = COMMON_LOCATORS
 
         # Components
         self._audio_modal = AudioModal(page, debug_enabled)
         self._voice_modal = VoiceModal(page, debug_enabled)
+        self._voice_modal_misses = 0
+        self._navigator = StoryNavigatorService(page, self._logger)
+
+        # Completion text or a "next story" label, resolved in one query
+        self._completion_indicator = page.get_by_text(
+            self._locators.COMPLETION_PATTERN
+        ).or_(page.get_by_text(self._locators.NEXT_STORY_PATTERN))
 
     def setup(self) -> bool:
         """
@@ -139,17 +151,14 @@ class StoriesWorkflow(BaseWorkflow):
 
         self._audio_modal.dismiss_if_present()
 
-        stories = []
+        stories = self._navigator.harvest_tiles()
+        if stories:
+            self._logger.info(f"Discovered {len(stories)} stories.")
+            return stories
 
-        for name in self._locators.KNOWN_STORIES:
-            try:
-                element = self._page.get_by_text(name, exact=True)
-                if element.count() > 0:
-                    self._logger.debug(f"✓ Found: {name}")
-                    stories.append((name, element.first))
-            except Exception:
-                pass
+        self._logger.debug("No story tiles found, falling back to known names.")
 
+        stories = self._navigator.find_known_stories()
         self._logger.info(f"Discovered {len(stories)} stories.")
         return stories
 
@@ -176,7 +185,7 @@ class StoriesWorkflow(BaseWorkflow):
 
             # Handle modals
             self._audio_modal.dismiss_if_present()
-            self._voice_modal.dismiss_if_present()
+            self._dismiss_voice_modal()
 
             # Set listen mode
             self._mode.set_listen_mode()
@@ -194,6 +203,16 @@ class StoriesWorkflow(BaseWorkflow):
             self._return_to_stories()
             return False
 
+    def _dismiss_voice_modal(self) -> None:
+        """Dismiss the voice modal until it has been absent for a while."""
+        if self._voice_modal_misses >= self.VOICE_MODAL_MISS_LIMIT:
+            return
+
+        if self._voice_modal.dismiss_if_present():
+            self._voice_modal_misses = 0
+        else:
+            self._voice_modal_misses += 1
+
     def _run_story_cycles(self, name: str, max_cycles: int = 5) -> None:
         """
         Run listen/read cycles for a story.
@@ -206,7 +225,7 @@ class StoriesWorkflow(BaseWorkflow):
             self._logger.debug(f"Cycle {cycle + 1} for '{name}'")
 
             self._audio.play()
-            self._wait(WaitTimes.ACTIVITY_CYCLE)
+            self._audio.wait_for_playback_end(WaitTimes.ACTIVITY_CYCLE)
             self._mode.alternate_modes()
 
             if self._is_story_completed():
@@ -218,22 +237,17 @@ class StoriesWorkflow(BaseWorkflow):
     def _is_story_completed(self) -> bool:
         """Check if story is completed."""
         try:
-            completion = self._page.get_by_text(self._locators.COMPLETION_PATTERN)
-            if completion.count() > 0:
-                return True
-
-            next_btn = self._page.get_by_text(self._locators.NEXT_STORY_PATTERN)
-            if next_btn.count() > 0:
-                return True
-
-            return False
+            return self._completion_indicator.count() > 0
         except Exception:
             return False
 
     def _return_to_stories(self) -> None:
-        """Return to stories list."""
+        """Return to stories list, going back in history when possible."""
+        if self._navigator.go_back_to_list():
+            return
+
         try:
-            self._page.goto(URLs.STORIES, wait_until="networkidle")
+            self._page.goto(URLs.STORIES, wait_until="domcontentloaded")
             self._wait(WaitTimes.SHORT)
         except Exception as e:
             self._logger.warn(f"Could not return to stories: {e}")